@@ -5,6 +5,7 @@ Market indicators API endpoints
 
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response
 import structlog
 
 from ...services.kis_api import get_kis_client
@@ -13,9 +14,13 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# 응답 래퍼의 고정 부분을 미리 직렬화 — 캐시된 지표 bytes를 끼워 넣기만 한다
+_INDICATORS_ENVELOPE_PREFIX = b'{"success":true,"data":'
+_INDICATORS_ENVELOPE_SUFFIX = b',"message":"Market indicators retrieved successfully"}'
 
-@router.get("/indicators", response_model=Dict[str, Any])
-async def get_market_indicators() -> Dict[str, Any]:
+
+@router.get("/indicators")
+async def get_market_indicators() -> Response:
     """
     시장 지표 조회
 
@@ -29,14 +34,14 @@ async def get_market_indicators() -> Dict[str, Any]:
     """
     try:
         kis_client = await get_kis_client()
-        indicators = await kis_client.get_market_indicators()
+        # 캐시 적중 시 미리 직렬화된 bytes를 그대로 전송 (dict→JSON 변환 생략)
+        data = await kis_client.get_market_indicators_bytes()
 
         logger.info("Market indicators retrieved successfully")
-        return {
-            "success": True,
-            "data": indicators,
-            "message": "Market indicators retrieved successfully"
-        }
+        return Response(
+            content=_INDICATORS_ENVELOPE_PREFIX + data + _INDICATORS_ENVELOPE_SUFFIX,
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.error(f"Error retrieving market indicators: {e}")
@@ -2,9 +2,10 @@
 WebSocket endpoint for real-time data streaming
 """
 
-import json
 import asyncio
 import logging
+
+import orjson
 from datetime import datetime
 from typing import Dict, Set, Any
 from fastapi import WebSocket, WebSocketDisconnect
@@ -34,30 +35,46 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, client_id: str):
         if client_id in self.active_connections:
             try:
-                await self.active_connections[client_id].send_text(json.dumps(message))
+                await self.active_connections[client_id].send_text(orjson.dumps(message).decode())
             except Exception as e:
                 logger.error(f"Error sending message to {client_id}: {e}")
                 self.disconnect(client_id)
 
+    # Clients per send batch — yield control between batches so a large
+    # broadcast cannot stall the event loop for the whole client list
+    BROADCAST_BATCH = 50
+
     async def broadcast(self, message: dict):
+        if not self.active_connections:
+            return
+
+        # Serialize once and reuse the text across all clients
+        text = orjson.dumps(message).decode()
         disconnected = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected.append(client_id)
+        clients = list(self.active_connections.items())
+
+        for start in range(0, len(clients), self.BROADCAST_BATCH):
+            for client_id, websocket in clients[start:start + self.BROADCAST_BATCH]:
+                try:
+                    await websocket.send_text(text)
+                except Exception as e:
+                    logger.error(f"Error broadcasting to {client_id}: {e}")
+                    disconnected.append(client_id)
+            # Let scheduler/monitoring coroutines run between batches
+            await asyncio.sleep(0)
 
         # Clean up disconnected clients
         for client_id in disconnected:
             self.disconnect(client_id)
 
     async def broadcast_to_subscribers(self, message: dict, symbol: str):
+        # Serialize once and reuse the text across all subscribers
+        text = orjson.dumps(message).decode()
         disconnected = []
-        for client_id, websocket in self.active_connections.items():
+        for client_id, websocket in list(self.active_connections.items()):
             if symbol in self.subscriptions.get(client_id, set()):
                 try:
-                    await websocket.send_text(json.dumps(message))
+                    await websocket.send_text(text)
                 except Exception as e:
                     logger.error(f"Error sending to subscriber {client_id}: {e}")
                     disconnected.append(client_id)
@@ -100,7 +117,7 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
 
             await handle_client_message(message, client_id)
 
@@ -329,6 +346,29 @@ async def send_exit_signal(position_id: str, symbol: str, current_price: float,
     }
     await manager.broadcast(message)
 
+async def send_market_indicators(data: dict):
+    """Send market indicators snapshot to all connected clients"""
+    message = {
+        "type": "market_indicators",
+        "timestamp": datetime.now().isoformat(),
+        "data": data
+    }
+    await manager.broadcast(message)
+
+async def send_scheduler_update(data: dict):
+    """Send scheduler status/task update to all connected clients
+
+    Awaited directly in the caller's context — no create_task/call_soon
+    dispatch in between, so no copy_context()/Context.run frame is paid
+    per send on the scheduler's broadcast path.
+    """
+    message = {
+        "type": "scheduler_update",
+        "timestamp": datetime.now().isoformat(),
+        "data": data
+    }
+    await manager.broadcast(message)
+
 async def send_strategy_update(data: dict):
     """Send strategy update to all connected clients"""
     message = {
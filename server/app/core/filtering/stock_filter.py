@@ -6,6 +6,7 @@ Stock filtering engine for momentum-based day trading strategy
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from operator import attrgetter
 
 import structlog
 from pydantic import BaseModel
@@ -162,19 +163,24 @@ class StockFilterEngine:
                 logger.warning(f"Volume ranking failed in {trading_mode} mode: {e}")
                 # 거래량 순위 실패시에도 필터링은 계속 진행 (기본 거래량 사용)
 
-            filtered_stocks = []
+            # 종목별 평가는 서로 독립이므로 동시성 제한 하에 병렬 실행
+            # (내부의 per-symbol API 호출은 클라이언트의 토큰 버킷이 속도를 제한)
+            results = await kis_client.fetch_many(
+                [
+                    self._evaluate_stock(stock_data, volume_map, conditions, kis_client)
+                    for stock_data in all_stocks
+                ]
+            )
 
-            for stock_data in all_stocks:
-                try:
-                    filtered_stock = await self._evaluate_stock(stock_data, volume_map, conditions, kis_client)
-                    if filtered_stock:
-                        filtered_stocks.append(filtered_stock)
-                except Exception as e:
-                    logger.warning(f"Error evaluating stock {stock_data.get('mksc_shrn_iscd', 'unknown')}: {str(e)}")
-                    continue
+            filtered_stocks = []
+            for stock_data, result in zip(all_stocks, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Error evaluating stock {stock_data.get('mksc_shrn_iscd', 'unknown')}: {result}")
+                elif result:
+                    filtered_stocks.append(result)
 
             # 점수순으로 정렬
-            filtered_stocks.sort(key=lambda x: x.score, reverse=True)
+            filtered_stocks.sort(key=attrgetter("score"), reverse=True)
 
             logger.info(f"Filtering completed: {len(filtered_stocks)} stocks passed filters")
             return filtered_stocks
@@ -5,6 +5,7 @@ KIS API를 통한 시장 데이터 수집기
 
 import json
 import asyncio
+import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -17,6 +18,13 @@ from ...utils.data_persistence import save_json_data, load_json_data
 
 logger = structlog.get_logger(__name__)
 
+# 모의 지수 생성용 기준가 테이블과 전용 난수 생성기 (호출마다 재구성하지 않음)
+_MOCK_INDEX_BASE_PRICES = {
+    "0001": 3200,  # KOSPI
+    "1001": 1000   # KOSDAQ
+}
+_rng = random.Random()
+
 
 class MarketIndexData(BaseModel):
     """시장 지수 데이터 모델"""
@@ -42,13 +50,13 @@ class MarketDataCollector:
         indices = {}
 
         try:
-            # KOSPI 데이터 수집
-            kospi_data = await self._get_index_data("0001", "KOSPI")
+            # KOSPI/KOSDAQ은 서로 독립이므로 동시 조회 (순차 호출 대비 왕복 절반)
+            kospi_data, kosdaq_data = await asyncio.gather(
+                self._get_index_data("0001", "KOSPI"),
+                self._get_index_data("1001", "KOSDAQ")
+            )
             if kospi_data:
                 indices["KOSPI"] = kospi_data
-
-            # KOSDAQ 데이터 수집
-            kosdaq_data = await self._get_index_data("1001", "KOSDAQ")
             if kosdaq_data:
                 indices["KOSDAQ"] = kosdaq_data
 
@@ -104,16 +112,10 @@ class MarketDataCollector:
 
     def _generate_mock_index_data(self, index_code: str, index_name: str) -> MarketIndexData:
         """모의투자용 가짜 지수 데이터 생성"""
-        import random
-
-        base_prices = {
-            "0001": 3200,  # KOSPI
-            "1001": 1000   # KOSDAQ
-        }
-
-        base_price = base_prices.get(index_code, 2500)
-        current_price = base_price + random.uniform(-50, 50)
-        price_change = random.uniform(-30, 30)
+        base_price = _MOCK_INDEX_BASE_PRICES.get(index_code, 2500)
+        # random()을 산술로 스케일 — uniform/randint의 인자 검증 오버헤드 회피
+        current_price = base_price + (_rng.random() - 0.5) * 100
+        price_change = (_rng.random() - 0.5) * 60
         change_rate = (price_change / base_price) * 100
 
         return MarketIndexData(
@@ -122,7 +124,7 @@ class MarketDataCollector:
             current_price=round(current_price, 2),
             price_change=round(price_change, 2),
             change_rate=round(change_rate, 2),
-            trading_volume=random.randint(100000000, 500000000),
+            trading_volume=100000000 + int(_rng.random() * 400000000),
             timestamp=datetime.now()
         )
 
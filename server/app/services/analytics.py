@@ -11,9 +11,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from pathlib import Path
 import statistics
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, asdict
 
-from app.utils.config import get_config
+from app.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +103,7 @@ class PerformanceAnalytics:
     """성과 분석 서비스"""
 
     def __init__(self):
-        self.config = get_config()
+        self.config = get_settings()
         self.data_dir = Path("data/analytics")
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -248,7 +249,7 @@ class PerformanceAnalytics:
 
         # 데이터 포맷팅
         result = []
-        for perf in sorted(filtered_performances, key=lambda x: x.date):
+        for perf in sorted(filtered_performances, key=attrgetter("date")):
             result.append({
                 "date": perf.date.isoformat(),
                 "total_trades": perf.total_trades,
@@ -331,7 +332,7 @@ class PerformanceAnalytics:
             })
 
         # 총 수익순 정렬
-        result.sort(key=lambda x: x["total_pnl"], reverse=True)
+        result.sort(key=itemgetter("total_pnl"), reverse=True)
 
         return result
 
@@ -6,19 +6,65 @@ Data simulator for WebSocket real-time data streaming
 import asyncio
 import logging
 import random
+from dataclasses import dataclass
 from datetime import datetime, time
+from enum import IntEnum
 from typing import Dict, List
 
+import numpy as np
+
 from app.api.websocket import send_price_update, send_buy_signal, send_session_status
 
 logger = logging.getLogger(__name__)
 
+class _Phase(IntEnum):
+    """시장 단계 구분"""
+    MARKET = 0       # 장중 (09:00-15:30)
+    AFTER_HOURS = 1  # 시간외 (16:00-17:40)
+    CLOSED = 2       # 폐장
+
+@dataclass(slots=True)
+class StockState:
+    """시뮬레이션 종목별 상태"""
+    name: str
+    current_price: int
+    base_price: int
+    volume: int
+    last_change: int = 0
+    trend: int = 0  # -1: 하락, 0: 보합, 1: 상승
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "current_price": self.current_price,
+            "base_price": self.base_price,
+            "volume": self.volume,
+            "last_change": self.last_change,
+            "trend": self.trend,
+        }
+
 class DataSimulator:
+    # 시장 단계 경계 (자정 기준 분 단위)
+    _MARKET_OPEN = 9 * 60          # 09:00
+    _MARKET_CLOSE = 15 * 60 + 30   # 15:30
+    _AFTER_OPEN = 16 * 60          # 16:00
+    _AFTER_CLOSE = 17 * 60 + 40    # 17:40
+
+    # 단계별 업데이트 간격 (초, _Phase 값으로 인덱싱)
+    _PHASE_SLEEP = (1, 2, 10)
+
     def __init__(self):
         self.is_running = False
-        self.stock_data: Dict[str, dict] = {}
+        self.stock_data: Dict[str, StockState] = {}
         self.simulation_task: asyncio.Task = None
 
+        # 시장 단계 캐시 (분 단위)
+        self._phase_cache_minute = -1
+        self._phase_cache_value = _Phase.CLOSED
+
+        # 숫자 상태용 난수 생성기 (벌크 샘플링)
+        self._nprng = np.random.default_rng()
+
         # 샘플 주식 데이터 초기화
         self.initialize_sample_stocks()
 
@@ -38,14 +84,76 @@ class DataSimulator:
         ]
 
         for stock in sample_stocks:
-            self.stock_data[stock["code"]] = {
-                "name": stock["name"],
-                "current_price": stock["base_price"],
-                "base_price": stock["base_price"],
-                "volume": random.randint(1000000, 10000000),
-                "last_change": 0,
-                "trend": random.choice([-1, 0, 1])  # -1: 하락, 0: 보합, 1: 상승
-            }
+            self.stock_data[stock["code"]] = StockState(
+                name=stock["name"],
+                current_price=stock["base_price"],
+                base_price=stock["base_price"],
+                volume=random.randint(1000000, 10000000),
+                trend=random.choice([-1, 0, 1])
+            )
+
+        self._build_state_arrays()
+
+    def _build_state_arrays(self):
+        """숫자 상태를 SoA(Struct-of-Arrays) NumPy 배열로 구성 - 틱 커널용"""
+        stocks = list(self.stock_data.values())
+
+        self._codes = list(self.stock_data.keys())
+        self._prices = np.array([s.current_price for s in stocks], dtype=np.float64)
+        self._base_prices = np.array([s.base_price for s in stocks], dtype=np.float64)
+        self._volumes = np.array([s.volume for s in stocks], dtype=np.int64)
+        self._trends = np.array([s.trend for s in stocks], dtype=np.float64)
+
+        # 가격 범위 제한 (base_price의 ±10%)
+        self._min_prices = self._base_prices * 0.9
+        self._max_prices = self._base_prices * 1.1
+
+    @staticmethod
+    def _tick(prices, volumes, trends, min_prices, max_prices, idx, u_samples, v_samples, tflip, tnew):
+        """per-tick 숫자 커널 - 선택된 종목의 가격/거래량/트렌드를 배열 상에서 일괄 갱신
+
+        순수 포인트와이즈 연산만 사용하므로 향후 numba.njit 컴파일이 가능한 형태.
+        반환값은 종목별 가격 변화량 배열.
+        """
+        old_prices = prices[idx]
+
+        # 가격 변동 계산 (랜덤 변동 + 트렌드 영향)
+        change_percent = u_samples + trends[idx] * 0.003
+        new_prices = old_prices * (1.0 + change_percent)
+        np.clip(new_prices, min_prices[idx], max_prices[idx], out=new_prices)
+        new_prices = np.rint(new_prices)
+
+        prices[idx] = new_prices
+
+        # 거래량 업데이트
+        volumes[idx] = np.maximum(100000, volumes[idx] + v_samples)
+
+        # 트렌드 조정 (10% 확률로 변경)
+        trends[idx] = np.where(tflip < 0.1, tnew, trends[idx])
+
+        return new_prices - old_prices
+
+    async def _run_tick(self, min_count: int, max_count: int, volatility: float):
+        """랜덤 종목을 선택해 틱 커널 실행 후 업데이트 전파"""
+        total = len(self._codes)
+        k = min(int(self._nprng.integers(min_count, max_count + 1)), total)
+        idx = self._nprng.choice(total, size=k, replace=False)
+
+        # 난수 샘플 벌크 추출
+        u_samples = self._nprng.uniform(-volatility, volatility, size=k)
+        v_samples = self._nprng.integers(-50000, 100001, size=k)
+        tflip = self._nprng.random(k)
+        tnew = self._nprng.integers(-1, 2, size=k).astype(np.float64)
+
+        changes = self._tick(
+            self._prices, self._volumes, self._trends,
+            self._min_prices, self._max_prices,
+            idx, u_samples, v_samples, tflip, tnew
+        )
+
+        # Python 레이어는 WebSocket 전송만 담당
+        for pos, i in enumerate(idx):
+            await self._emit_stock_update(int(i), float(changes[pos]))
 
     async def start_simulation(self):
         """시뮬레이션 시작"""
@@ -67,43 +175,53 @@ class DataSimulator:
         self.is_running = False
         logger.info("Stopping data simulation")
 
-        if self.simulation_task and not self.simulation_task.done():
-            self.simulation_task.cancel()
+        task = self.simulation_task
+        if task and not task.done():
+            task.cancel()
             try:
-                await self.simulation_task
+                # shield: stop_simulation 자체가 취소되어도 태스크 정리는 계속 진행
+                # wait_for: 종료 대기가 무한정 걸리지 않도록 상한 설정
+                await asyncio.wait_for(asyncio.shield(task), timeout=5.0)
             except asyncio.CancelledError:
                 logger.info("Simulation task cancelled")
+            except asyncio.TimeoutError:
+                logger.warning("Simulation task did not stop within 5s after cancel")
+
+        self.simulation_task = None
+
+    def _market_phase(self, now_t: time) -> _Phase:
+        """현재 시장 단계 판별 (분 단위 캐시)"""
+        minute = now_t.hour * 60 + now_t.minute
+
+        if minute == self._phase_cache_minute:
+            return self._phase_cache_value
+
+        if self._MARKET_OPEN <= minute <= self._MARKET_CLOSE:
+            phase = _Phase.MARKET
+        elif self._AFTER_OPEN <= minute <= self._AFTER_CLOSE:
+            phase = _Phase.AFTER_HOURS
+        else:
+            phase = _Phase.CLOSED
+
+        self._phase_cache_minute = minute
+        self._phase_cache_value = phase
+        return phase
 
     async def _simulation_loop(self):
         """실시간 데이터 시뮬레이션 루프"""
         try:
             while self.is_running:
-                current_time = datetime.now().time()
+                phase = self._market_phase(datetime.now().time())
 
-                # 장중 시간인지 확인 (09:00 - 15:30)
-                is_market_hours = (
-                    time(9, 0) <= current_time <= time(15, 30)
-                )
-
-                # 시간외 시간인지 확인 (16:00 - 17:40)
-                is_after_hours = (
-                    time(16, 0) <= current_time <= time(17, 40)
-                )
-
-                if is_market_hours or is_after_hours:
-                    # 활발한 거래 시뮬레이션
-                    await self._simulate_active_trading()
-                else:
+                if phase is _Phase.CLOSED:
                     # 비활성 시간 - 낮은 빈도 업데이트
                     await self._simulate_inactive_period()
-
-                # 업데이트 간격 (시장 상황에 따라 조정)
-                if is_market_hours:
-                    await asyncio.sleep(1)  # 1초마다 업데이트
-                elif is_after_hours:
-                    await asyncio.sleep(2)  # 2초마다 업데이트
                 else:
-                    await asyncio.sleep(10)  # 10초마다 업데이트
+                    # 활발한 거래 시뮬레이션
+                    await self._simulate_active_trading()
+
+                # 업데이트 간격 (시장 단계에 따라 조정)
+                await asyncio.sleep(self._PHASE_SLEEP[phase])
 
         except asyncio.CancelledError:
             logger.info("Simulation loop cancelled")
@@ -114,14 +232,8 @@ class DataSimulator:
 
     async def _simulate_active_trading(self):
         """활발한 거래 시뮬레이션"""
-        # 랜덤하게 몇 개 주식 선택하여 업데이트
-        selected_stocks = random.sample(
-            list(self.stock_data.keys()),
-            k=random.randint(3, 7)
-        )
-
-        for stock_code in selected_stocks:
-            await self._update_stock_price(stock_code, volatility=0.02)
+        # 랜덤하게 몇 개 주식 선택하여 일괄 업데이트
+        await self._run_tick(3, 7, volatility=0.02)
 
         # 매수 신호 시뮬레이션 (낮은 확률)
         if random.random() < 0.05:  # 5% 확률
@@ -130,55 +242,31 @@ class DataSimulator:
     async def _simulate_inactive_period(self):
         """비활성 시간 시뮬레이션"""
         # 적은 수의 주식만 업데이트
-        selected_stocks = random.sample(
-            list(self.stock_data.keys()),
-            k=random.randint(1, 3)
-        )
-
-        for stock_code in selected_stocks:
-            await self._update_stock_price(stock_code, volatility=0.005)
+        await self._run_tick(1, 3, volatility=0.005)
 
-    async def _update_stock_price(self, stock_code: str, volatility: float = 0.01):
-        """주식 가격 업데이트"""
+    async def _emit_stock_update(self, index: int, price_change: float):
+        """틱 커널 결과를 dict 상태에 반영하고 WebSocket으로 전파"""
+        stock_code = self._codes[index]
         stock = self.stock_data[stock_code]
 
-        # 가격 변동 계산
-        base_change = random.uniform(-volatility, volatility)
-        trend_influence = stock["trend"] * 0.003  # 트렌드 영향
+        new_price = int(self._prices[index])
+        old_price = new_price - int(price_change)
 
-        change_percent = base_change + trend_influence
-        price_change = stock["current_price"] * change_percent
-        new_price = stock["current_price"] + price_change
-
-        # 가격 범위 제한 (base_price의 ±10%)
-        min_price = stock["base_price"] * 0.9
-        max_price = stock["base_price"] * 1.1
-        new_price = max(min_price, min(max_price, new_price))
-
-        # 거래량 업데이트
-        volume_change = random.randint(-50000, 100000)
-        new_volume = max(100000, stock["volume"] + volume_change)
-
-        # 데이터 업데이트
-        old_price = stock["current_price"]
-        stock["current_price"] = round(new_price)
-        stock["volume"] = new_volume
-        stock["last_change"] = stock["current_price"] - old_price
-
-        # 트렌드 조정 (확률적)
-        if random.random() < 0.1:  # 10% 확률로 트렌드 변경
-            stock["trend"] = random.choice([-1, 0, 1])
+        stock.current_price = new_price
+        stock.volume = int(self._volumes[index])
+        stock.last_change = int(price_change)
+        stock.trend = int(self._trends[index])
 
         # 가격 변동률 계산
-        change_percent = ((stock["current_price"] - old_price) / old_price) * 100 if old_price > 0 else 0
+        change_percent = ((new_price - old_price) / old_price) * 100 if old_price > 0 else 0
 
         # WebSocket으로 가격 업데이트 전송
         await send_price_update(
             symbol=stock_code,
-            price=stock["current_price"],
-            change=stock["last_change"],
+            price=stock.current_price,
+            change=stock.last_change,
             change_percent=change_percent,
-            volume=stock["volume"]
+            volume=stock.volume
         )
 
         # 신호 처리기에 가격 업데이트 전달 (자동 매수 신호 생성을 위해)
@@ -186,10 +274,10 @@ class DataSimulator:
             from ..core.trading.signal_processor import signal_processor
             await signal_processor.process_price_update(
                 symbol=stock_code,
-                stock_name=stock["name"],
-                current_price=stock["current_price"],
+                stock_name=stock.name,
+                current_price=stock.current_price,
                 change_percent=change_percent,
-                volume=stock["volume"],
+                volume=stock.volume,
                 threshold_percent=2.0  # 2% 이상 상승 시 신호 생성
             )
         except Exception as e:
@@ -202,14 +290,14 @@ class DataSimulator:
         stock = self.stock_data[stock_code]
 
         # 매수 신호 조건 시뮬레이션
-        change_percent = ((stock["current_price"] - stock["base_price"]) / stock["base_price"]) * 100
+        change_percent = ((stock.current_price - stock.base_price) / stock.base_price) * 100
 
         if change_percent > 1.5:  # 1.5% 이상 상승 시 매수 신호
             quantity = random.randint(10, 100) * 10  # 10주 단위
 
             await send_buy_signal(
                 symbol=stock_code,
-                price=stock["current_price"],
+                price=stock.current_price,
                 quantity=quantity,
                 reason=f"{change_percent:.2f}% 상승으로 인한 모멘텀 매수",
                 order_id=f"SIM_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -237,12 +325,13 @@ class DataSimulator:
             logger.warning(f"Failed to get session manager status: {e}")
 
         # 기본 세션 상태 로직
-        if time(9, 0) <= current_time <= time(15, 30):
+        market_phase = self._market_phase(current_time)
+        if market_phase is _Phase.MARKET:
             day = "day2"
             phase = "trading"
             status = "active"
             next_action = "position_monitoring"
-        elif time(16, 0) <= current_time <= time(17, 40):
+        elif market_phase is _Phase.AFTER_HOURS:
             day = "day1"
             phase = "after_hours_monitoring"
             status = "monitoring"
@@ -263,11 +352,13 @@ class DataSimulator:
 
     def _get_next_action_time(self, current_time: time) -> str:
         """다음 액션 시간 계산"""
-        if current_time < time(9, 0):
+        minute = current_time.hour * 60 + current_time.minute
+
+        if minute < self._MARKET_OPEN:
             return "09:00"
-        elif current_time < time(16, 0):
+        elif minute < self._AFTER_OPEN:
             return "16:00"
-        elif current_time < time(17, 40):
+        elif minute < self._AFTER_CLOSE:
             return self._get_next_monitoring_time(current_time)
         else:
             return "09:00 (다음 날)"
@@ -284,7 +375,7 @@ class DataSimulator:
 
     def get_current_prices(self) -> Dict[str, dict]:
         """현재 가격 정보 반환"""
-        return self.stock_data.copy()
+        return {code: state.to_dict() for code, state in self.stock_data.items()}
 
 # 글로벌 시뮬레이터 인스턴스
 data_simulator = DataSimulator()
\ No newline at end of file
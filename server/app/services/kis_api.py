@@ -6,13 +6,18 @@ KIS (Korea Investment & Securities) Open API Client
 import asyncio
 import hashlib
 import hmac
-import json
+import sys
 import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlencode
 
 import aiohttp
+import numpy as np
+import orjson
 import structlog
 from pydantic import BaseModel
 
@@ -29,10 +34,652 @@ class KISTokenResponse(BaseModel):
     expires_in: int
 
 
+# 정적 요청 파라미터 템플릿 (호출 시 dict(...)로 동적 키만 덮어쓴다)
+_PARAMS_VOLUME_RANK = MappingProxyType({
+    "FID_COND_MRKT_DIV_CODE": "J",
+    "FID_COND_SCR_DIV_CODE": "20171",  # 올바른 화면번호
+    "FID_INPUT_ISCD": "0000",
+    "FID_DIV_CLS_CODE": "0",
+    "FID_BLNG_CLS_CODE": "0",
+    "FID_TRGT_CLS_CODE": "111111111",
+    "FID_TRGT_EXLS_CLS_CODE": "000000",
+    "FID_INPUT_PRICE_1": "0",  # 빈 문자열 대신 "0"
+    "FID_INPUT_PRICE_2": "0",  # 빈 문자열 대신 "0"
+    "FID_VOL_CNT": "0",        # 1000 대신 "0"
+    "FID_INPUT_DATE_1": "0"    # 누락된 필수 파라미터 추가
+})
+
+_PARAMS_RETURN_RANK = MappingProxyType({
+    "fid_cond_mrkt_div_code": "J",
+    "fid_cond_scr_div_code": "20170",  # 등락률 순위 화면 코드
+    "fid_input_iscd": "0000",          # 전체
+    "fid_rank_sort_cls_code": "0",     # 0:상승율순 (내림차순)
+    "fid_input_cnt_1": "0",            # 전체
+    "fid_prc_cls_code": "0",           # 전체
+    "fid_input_price_1": "",           # 공백
+    "fid_input_price_2": "",           # 공백
+    "fid_vol_cnt": "",                 # 공백
+    "fid_trgt_cls_code": "0",          # 전체
+    "fid_trgt_exls_cls_code": "0",     # 전체
+    "fid_div_cls_code": "0",           # 전체
+    "fid_rsfl_rate1": "",              # 공백
+    "fid_rsfl_rate2": ""               # 공백
+})
+
+
+def _freeze_rows(*rows: Dict[str, Any]) -> tuple:
+    """폴백 테이블 행을 읽기 전용 뷰로 고정 (공유 상수 오염 방지)"""
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+# 폴백/모의 응답 데이터: 모듈 로드 시 1회만 구성하고, 호출 시에는
+# 호출자가 수정해도 원본이 오염되지 않도록 행 단위 얕은 복사로 반환한다
+_FALLBACK_BASIC_STOCKS = _freeze_rows(
+    {"mksc_shrn_iscd": "005930", "hts_kor_isnm": "삼성전자 (Mock)"},
+    {"mksc_shrn_iscd": "000660", "hts_kor_isnm": "SK하이닉스 (Mock)"},
+    {"mksc_shrn_iscd": "035420", "hts_kor_isnm": "NAVER (Mock)"},
+    {"mksc_shrn_iscd": "051910", "hts_kor_isnm": "LG화학 (Mock)"},
+    {"mksc_shrn_iscd": "006400", "hts_kor_isnm": "삼성SDI (Mock)"}
+)
+
+_MOCK_VOLUME_RANKING = _freeze_rows(
+    {
+        "mksc_shrn_iscd": "005930",
+        "hts_kor_isnm": "삼성전자 (Mock)",
+        "stck_prpr": "79700",
+        "acml_vol": "20898386",
+        "prdy_ctrt": "-0.99"
+    },
+    {
+        "mksc_shrn_iscd": "000660",
+        "hts_kor_isnm": "SK하이닉스 (Mock)",
+        "stck_prpr": "353000",
+        "acml_vol": "4385543",
+        "prdy_ctrt": "0.00"
+    },
+    {
+        "mksc_shrn_iscd": "035720",
+        "hts_kor_isnm": "카카오 (Mock)",
+        "stck_prpr": "67000",
+        "acml_vol": "5009911",
+        "prdy_ctrt": "3.55"
+    }
+)
+
+_FALLBACK_VOLUME_RANKING = _freeze_rows(
+    {
+        "mksc_shrn_iscd": "005930",
+        "hts_kor_isnm": "삼성전자",
+        "stck_prpr": "79700",
+        "acml_vol": "20898386",
+        "prdy_ctrt": "-0.99"
+    },
+    {
+        "mksc_shrn_iscd": "000660",
+        "hts_kor_isnm": "SK하이닉스",
+        "stck_prpr": "353000",
+        "acml_vol": "4385543",
+        "prdy_ctrt": "0.00"
+    },
+    {
+        "mksc_shrn_iscd": "035720",
+        "hts_kor_isnm": "카카오",
+        "stck_prpr": "67000",
+        "acml_vol": "5009911",
+        "prdy_ctrt": "3.55"
+    },
+    {
+        "mksc_shrn_iscd": "035420",
+        "hts_kor_isnm": "NAVER",
+        "stck_prpr": "234000",
+        "acml_vol": "1585243",
+        "prdy_ctrt": "-1.89"
+    },
+    {
+        "mksc_shrn_iscd": "005380",
+        "hts_kor_isnm": "현대차",
+        "stck_prpr": "214000",
+        "acml_vol": "1301527",
+        "prdy_ctrt": "-2.06"
+    },
+    {
+        "mksc_shrn_iscd": "000270",
+        "hts_kor_isnm": "기아",
+        "stck_prpr": "101600",
+        "acml_vol": "1545375",
+        "prdy_ctrt": "-0.49"
+    },
+    {
+        "mksc_shrn_iscd": "006400",
+        "hts_kor_isnm": "삼성SDI",
+        "stck_prpr": "203000",
+        "acml_vol": "858121",
+        "prdy_ctrt": "-2.87"
+    },
+    {
+        "mksc_shrn_iscd": "051910",
+        "hts_kor_isnm": "LG화학",
+        "stck_prpr": "291000",
+        "acml_vol": "343090",
+        "prdy_ctrt": "-3.32"
+    },
+    {
+        "mksc_shrn_iscd": "068270",
+        "hts_kor_isnm": "셀트리온",
+        "stck_prpr": "170800",
+        "acml_vol": "457846",
+        "prdy_ctrt": "1.36"
+    },
+    {
+        "mksc_shrn_iscd": "207940",
+        "hts_kor_isnm": "삼성바이오로직스",
+        "stck_prpr": "1024000",
+        "acml_vol": "91201",
+        "prdy_ctrt": "-0.49"
+    }
+)
+
+_MOCK_RETURN_RANKING = _freeze_rows(
+    {
+        "stck_shrn_iscd": "000040",
+        "hts_kor_isnm": "KR모터스 (Mock)",
+        "stck_prpr": "1821",
+        "prdy_ctrt": "12.13",
+        "acml_vol": "2267183",
+        "data_rank": "1"
+    },
+    {
+        "stck_shrn_iscd": "032800",
+        "hts_kor_isnm": "판타지오 (Mock)",
+        "stck_prpr": "406",
+        "prdy_ctrt": "22.66",
+        "acml_vol": "36313396",
+        "data_rank": "2"
+    },
+    {
+        "stck_shrn_iscd": "018000",
+        "hts_kor_isnm": "유니슨 (Mock)",
+        "stck_prpr": "1233",
+        "prdy_ctrt": "21.12",
+        "acml_vol": "2436474",
+        "data_rank": "3"
+    }
+)
+
+_FALLBACK_RETURN_RANKING = _freeze_rows(
+    {
+        "stck_shrn_iscd": "000040",
+        "hts_kor_isnm": "KR모터스",
+        "stck_prpr": "1821",
+        "prdy_ctrt": "12.13",
+        "acml_vol": "2267183",
+        "data_rank": "1"
+    },
+    {
+        "stck_shrn_iscd": "032800",
+        "hts_kor_isnm": "판타지오",
+        "stck_prpr": "406",
+        "prdy_ctrt": "22.66",
+        "acml_vol": "36313396",
+        "data_rank": "2"
+    },
+    {
+        "stck_shrn_iscd": "018000",
+        "hts_kor_isnm": "유니슨",
+        "stck_prpr": "1233",
+        "prdy_ctrt": "21.12",
+        "acml_vol": "2436474",
+        "data_rank": "3"
+    },
+    {
+        "stck_shrn_iscd": "083790",
+        "hts_kor_isnm": "CG인바이츠",
+        "stck_prpr": "4025",
+        "prdy_ctrt": "19.08",
+        "acml_vol": "1666447",
+        "data_rank": "4"
+    },
+    {
+        "stck_shrn_iscd": "237690",
+        "hts_kor_isnm": "에스티팜",
+        "stck_prpr": "93400",
+        "prdy_ctrt": "20.36",
+        "acml_vol": "1368523",
+        "data_rank": "5"
+    },
+    {
+        "stck_shrn_iscd": "065150",
+        "hts_kor_isnm": "대산F&B",
+        "stck_prpr": "239",
+        "prdy_ctrt": "16.02",
+        "acml_vol": "5046848",
+        "data_rank": "6"
+    },
+    {
+        "stck_shrn_iscd": "008600",
+        "hts_kor_isnm": "윌비스",
+        "stck_prpr": "596",
+        "prdy_ctrt": "12.45",
+        "acml_vol": "3819993",
+        "data_rank": "7"
+    },
+    {
+        "stck_shrn_iscd": "219130",
+        "hts_kor_isnm": "타이거일렉",
+        "stck_prpr": "37700",
+        "prdy_ctrt": "14.24",
+        "acml_vol": "188206",
+        "data_rank": "8"
+    },
+    {
+        "stck_shrn_iscd": "004380",
+        "hts_kor_isnm": "삼익THK",
+        "stck_prpr": "17290",
+        "prdy_ctrt": "13.82",
+        "acml_vol": "2290984",
+        "data_rank": "9"
+    },
+    {
+        "stck_shrn_iscd": "321370",
+        "hts_kor_isnm": "센서뷰",
+        "stck_prpr": "5020",
+        "prdy_ctrt": "22.44",
+        "acml_vol": "4923442",
+        "data_rank": "10"
+    }
+)
+
+
+# 후반부(14:00-15:30) 구간 경계 (HHMMSS를 정수로 비교)
+_LATE_SESSION_START = 140000
+_LATE_SESSION_END = 153000
+
+# 고정 환율 블록 (KIS API 미제공 — 정상/폴백 경로가 같은 객체를 참조)
+# JSON 직렬화 호환을 위해 proxy가 아닌 평범한 dict로 유지한다
+_DEFAULT_USD_KRW = {
+    "current": 1340.5,
+    "change": 5.2,
+    "change_rate": 0.39,
+    "status": "static_data",
+    "note": "환율 데이터는 KIS API 미제공으로 정적 값 사용"
+}
+
+# 지표 집계 실패 시의 폴백 페이로드 정적 부분 (에러 경로에서 얕은 복사 후
+# market_status/error만 패치 — 실패 폭주 시 dict 재구성 비용 제거)
+_FALLBACK_INDICATORS_TEMPLATE = {
+    "kospi": {"error": "API 연결 실패", "status": "error"},
+    "kosdaq": {"error": "API 연결 실패", "status": "error"},
+    "usd_krw": _DEFAULT_USD_KRW,
+    "volume_leaders": [],
+    "message": "Live Trading 모드에서는 실제 KIS API 데이터가 필요합니다"
+}
+
+# 시뮬레이션 모드의 지수 코드별 mock 데이터 (if/elif 체인 대신 dict 디스패치)
+_SIM_INDEX_DATA = {
+    "0001": {  # KOSPI
+        "current": 2580.45,
+        "change": 30.2,
+        "change_rate": 1.2,
+        "volume": 450000000,
+        "status": "open"
+    },
+    "1001": {  # KOSDAQ
+        "current": 768.92,
+        "change": -6.1,
+        "change_rate": -0.8,
+        "volume": 680000000,
+        "status": "open"
+    }
+}
+
+# 시뮬레이션 주문 응답의 정적 골격 — 호출마다 동적 필드(output)만 조립
+_SIM_ORDER_SKEL = MappingProxyType({
+    "rt_cd": "0",  # 성공 코드
+    "msg_cd": "MCA00000",
+    "msg1": "주문이 완료되었습니다."
+})
+
+
+# 지수 코드 → 표시 이름
+_INDEX_NAMES = MappingProxyType({
+    "0001": "KOSPI",
+    "1001": "KOSDAQ",
+    "2001": "KOSPI200"
+})
+
+# 지수 응답 필드 매핑: (결과 키, KIS 응답 키, 변환 타입)
+# 변환 None은 문자열 필드 (결측 시 빈 문자열)
+_INDEX_PRICE_FIELDS = (
+    ("current_price", "bstp_nmix_prpr", float),
+    ("change", "bstp_nmix_prdy_vrss", float),
+    ("change_rate", "bstp_nmix_prdy_ctrt", float),
+    ("change_sign", "prdy_vrss_sign", None),
+    ("volume", "acml_vol", int),
+    ("trade_amount", "acml_tr_pbmn", int),
+    ("open_price", "bstp_nmix_oprc", float),
+    ("high_price", "bstp_nmix_hgpr", float),
+    ("low_price", "bstp_nmix_lwpr", float),
+    ("up_count", "ascn_issu_cnt", int),
+    ("down_count", "down_issu_cnt", int),
+    ("unchanged_count", "stnr_issu_cnt", int),
+    ("year_high", "dryy_bstp_nmix_hgpr", float),
+    ("year_high_date", "dryy_bstp_nmix_hgpr_date", None),
+    ("year_low", "dryy_bstp_nmix_lwpr", float),
+    ("year_low_date", "dryy_bstp_nmix_lwpr_date", None)
+)
+
+
+# 모의 지수 데이터의 기준가 (지수 코드별)
+_MOCK_INDEX_BASE_PRICES = MappingProxyType({
+    "0001": 3200,  # KOSPI
+    "1001": 1000,  # KOSDAQ
+    "2001": 430    # KOSPI200
+})
+
+# 자주 쓰는 KIS TR_ID 상수 — intern으로 고정해 헤더 dict 해시/비교를 식별자 비교로
+_TR_DAILY_PRICE = sys.intern("FHKST01010400")
+_TR_STOCK_PRICE = sys.intern("FHKST01010100")
+_TR_AFTER_HOURS = sys.intern("FHKST01010200")
+_TR_ASKING_PRICE = sys.intern("FHKST01010300")
+_TR_VOLUME_RANK = sys.intern("FHPST01710000")
+_TR_RETURN_RANK = sys.intern("FHPST01700000")
+_TR_MINUTE_CHART = sys.intern("FHKST03010200")
+_TR_DAILY_CHART = sys.intern("FHKST03010100")
+_TR_PRICE_BATCH = sys.intern("FHKST11300006")
+_TR_INDEX_PRICE = sys.intern("FHPUP02100000")
+
+
+# 시장 세션 경계 (HHMM을 정수로 비교)
+_MARKET_OPEN_HHMM = 900      # 09:00 정규장 시작
+_MARKET_CLOSE_HHMM = 1530    # 15:30 정규장 종료
+_AFTER_HOURS_CLOSE_HHMM = 1800  # 18:00 시간외 종료
+
+# bisect용 세션 경계/이름 테이블 — 각 경계는 해당 세션이 시작되는 첫 HHMM
+# (09:00 정규장, 15:31 시간외, 18:01 장마감)
+_SESSION_BOUNDARIES = (_MARKET_OPEN_HHMM, _MARKET_CLOSE_HHMM + 1, _AFTER_HOURS_CLOSE_HHMM + 1)
+_SESSION_NAMES = ("pre_market", "regular", "after_hours", "closed")
+
+# 요일(월=0)별 다음 개장일까지의 일수 — 금요일 +3, 토요일 +2, 그 외 +1
+_NEXT_OPEN_DAYS = (1, 1, 1, 1, 3, 2, 1)
+
+
+def _hm(now: datetime) -> int:
+    """datetime을 HHMM 정수로 변환 (strftime/문자열 비교 회피)"""
+    return now.hour * 100 + now.minute
+
+
+# 초 단위 ISO 타임스탬프 캐시: (문자열, 초)
+_last_iso: tuple = ("", 0)
+
+
+def _now_iso() -> str:
+    """초가 바뀔 때만 재포맷하는 datetime.now().isoformat() 대체
+
+    last_updated류 필드는 초 정밀도면 충분하므로, 같은 초 내의 반복
+    호출은 캐싱된 문자열을 그대로 반환한다.
+    """
+    global _last_iso
+
+    now_second = int(time.time())
+    if _last_iso[1] != now_second:
+        _last_iso = (datetime.fromtimestamp(now_second).isoformat(), now_second)
+    return _last_iso[0]
+
+
+def _to_float(row: Dict[str, Any], key: str, default: float = 0.0) -> float:
+    """KIS 숫자 문자열 필드를 float으로 변환 (결측/공백은 default)"""
+    value = row.get(key)
+    if value is None or value == '':
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_int(row: Dict[str, Any], key: str, default: int = 0) -> int:
+    """KIS 숫자 문자열 필드를 int로 변환 (결측/공백은 default)"""
+    value = row.get(key)
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _rows_to_soa(rows: List[Dict[str, Any]], schema: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """행 단위 dict 목록(AoS)을 컬럼 단위 ndarray(SoA)로 변환
+
+    KIS 응답은 모든 값이 문자열이므로, schema로 지정한 dtype으로
+    컬럼당 한 번만 파싱한다. 예) {"stck_prpr": np.float64, "cntg_vol": np.int64}
+    """
+    count = len(rows)
+    columns: Dict[str, np.ndarray] = {}
+
+    for field, dtype in schema.items():
+        if dtype is np.float64:
+            columns[field] = np.fromiter(
+                (float(r.get(field, 0) or 0) for r in rows),
+                dtype=np.float64, count=count
+            )
+        elif dtype is np.int64:
+            columns[field] = np.fromiter(
+                (int(r.get(field, 0) or 0) for r in rows),
+                dtype=np.int64, count=count
+            )
+        else:
+            columns[field] = np.array([r.get(field, '') or '' for r in rows])
+
+    return columns
+
+
+# 모멘텀 커널이 쓰는 분봉 컬럼 스키마 (호출마다 dict를 다시 만들지 않음)
+_MOMENTUM_SCHEMA = {
+    'stck_prpr': np.float64,       # 가격
+    'cntg_vol': np.int64,          # 거래량
+    'stck_cntg_hour': np.int64     # 시각 (HHMMSS → 정수)
+}
+
+
+# numba가 설치되어 있으면 단일 패스 명시 루프 커널을 JIT 컴파일해 사용하고,
+# 없으면 아래 벡터화된 numpy 경로로 동작한다 (선택 의존성)
+try:
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _momentum_reduce(prices, volumes, hours):
+        """한 번의 루프로 (총거래량, 후반거래량, ΣPV, 후반 시가/종가, 후반 캔들 수) 집계"""
+        total_volume = 0
+        late_volume = 0
+        late_count = 0
+        pv_sum = 0.0
+        first_hour = -1
+        last_hour = -1
+        first_price = 0.0
+        last_price = 0.0
+        for i in range(hours.shape[0]):
+            v = volumes[i]
+            p = prices[i]
+            total_volume += v
+            pv_sum += p * v
+            h = hours[i]
+            if _LATE_SESSION_START <= h <= _LATE_SESSION_END:
+                late_volume += v
+                late_count += 1
+                if first_hour < 0 or h < first_hour:
+                    first_hour = h
+                    first_price = p
+                if h > last_hour:
+                    last_hour = h
+                    last_price = p
+        return total_volume, late_volume, pv_sum, first_price, last_price, late_count
+
+except ImportError:
+    _momentum_reduce = None
+
+
+def _compute_momentum(minute_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """분봉 캔들 목록으로부터 후반부 모멘텀 지표를 계산하는 순수 함수
+
+    I/O와 분리된 CPU 전용 경로로, 종목당 한 번씩 호출되는 핫스팟이다.
+    """
+    # 캔들 목록을 응답 경계에서 한 번만 SoA 컬럼으로 변환
+    columns = _rows_to_soa(minute_data, _MOMENTUM_SCHEMA)
+    prices = columns['stck_prpr']
+    volumes = columns['cntg_vol']
+    hours = columns['stck_cntg_hour']
+
+    first_price = last_price = 0.0
+    late_count = 0
+
+    if _momentum_reduce is not None:
+        # JIT 커널: 배열 3개를 한 번만 훑는 융합 패스
+        (total_volume, late_session_volume, pv_sum,
+         first_price, last_price, late_count) = _momentum_reduce(prices, volumes, hours)
+    else:
+        total_volume = int(volumes.sum())
+
+        # 14:00-15:30 시간대 마스크 — 합계는 마스크 내적으로 (중간 복사본 없이)
+        late_mask = (hours >= _LATE_SESSION_START) & (hours <= _LATE_SESSION_END)
+        late_session_volume = int(volumes @ late_mask)
+        pv_sum = float(prices @ volumes)
+
+        # 합계/VWAP은 순서 무관이고 필요한 것은 구간의 처음/마지막 가격뿐이므로
+        # 전체 정렬 대신 구간 내 최소/최대 시각 위치만 O(n)으로 찾는다
+        # (정렬 배열을 유지하지 않으므로 bisect 경계 탐색은 적용 불가 —
+        #  정렬 비용 O(n log n)을 내느니 무정렬 O(n) 스캔이 싸다)
+        late_idx = np.flatnonzero(late_mask)
+        late_count = int(late_idx.size)
+        if late_count >= 2:
+            late_hours = hours[late_idx]
+            first_price = float(prices[late_idx[np.argmin(late_hours)]])
+            last_price = float(prices[late_idx[np.argmax(late_hours)]])
+
+    # 후반부 상승률 계산 (14:00 가격 대비 15:30 가격)
+    late_session_return: float = 0.0
+    if late_count >= 2 and first_price > 0:
+        late_session_return = (last_price - first_price) / first_price * 100
+
+    # 후반부 거래량 비중 계산
+    late_volume_ratio: float = 0.0
+    if total_volume > 0:
+        late_volume_ratio = (late_session_volume / total_volume) * 100
+
+    # VWAP 계산 (거래량 가중 평균가)
+    vwap: float = float(pv_sum / total_volume) if total_volume > 0 else 0.0
+
+    return {
+        'late_session_return': late_session_return,
+        'late_session_volume_ratio': late_volume_ratio,
+        'vwap': vwap,
+        'total_volume': int(total_volume),
+        'late_session_volume': int(late_session_volume),
+        'data_points': len(minute_data)
+    }
+
+
+# 모듈 전역 커넥터: 모든 KISAPIClient 인스턴스가 하나의 커넥션 풀을 공유
+_global_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def _get_global_connector() -> aiohttp.TCPConnector:
+    """공유 TCPConnector 반환 (필요 시 생성)"""
+    global _global_connector
+
+    if _global_connector is None or _global_connector.closed:
+        import ssl
+        # SSL 인증서 검증 우회 (개발 환경용)
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        # TLS 세션 티켓 허용 — 재접속 시 축약 핸드셰이크(1-RTT 절감, 비대칭 연산 생략)
+        # 컨텍스트가 커넥터와 함께 전역 공유되므로 티켓 캐시도 프로세스 수명 동안 유지
+        ssl_context.options &= ~ssl.OP_NO_TICKET
+
+        # aiodns가 있으면 c-ares 기반 비동기 리졸버 사용
+        # (기본 스레드풀 getaddrinfo의 executor 점유/지연 회피, 없으면 기본값)
+        resolver = None
+        try:
+            import aiodns  # noqa: F401
+            from aiohttp.resolver import AsyncResolver
+            resolver = AsyncResolver()
+        except ImportError:
+            logger.debug("aiodns not installed; using default threaded resolver")
+
+        # 커넥션 풀 / keep-alive 튜닝: 반복 호출 시 TCP+TLS 핸드셰이크 재사용
+        _global_connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            resolver=resolver,
+            limit=200,
+            limit_per_host=50,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            force_close=False
+        )
+
+    return _global_connector
+
+
+# 모듈 전역 공유 ClientSession — 커넥터처럼 모든 클라이언트 인스턴스가 공유
+# (모니터링/트레이딩 모듈이 각자 KISAPIClient를 만들어도 세션은 하나)
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_refs = 0
+
+
+def _acquire_shared_session() -> aiohttp.ClientSession:
+    """공유 세션 참조 획득 (필요 시 생성)
+
+    생성은 동기 경로라 await 없이 검사-생성이 원자적이다 (단일 루프 기준).
+    """
+    global _shared_session, _shared_session_refs
+
+    if _shared_session is None or _shared_session.closed:
+        timeout = aiohttp.ClientTimeout(total=30)
+        _shared_session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=_get_global_connector(),
+            connector_owner=False,
+            headers={"Connection": "keep-alive"},
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
+        _shared_session_refs = 0
+
+    _shared_session_refs += 1
+    return _shared_session
+
+
+async def _release_shared_session():
+    """공유 세션 참조 반환 — 마지막 참조가 반환될 때만 실제로 닫음"""
+    global _shared_session, _shared_session_refs
+
+    _shared_session_refs -= 1
+    if _shared_session_refs <= 0 and _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+        _shared_session_refs = 0
+
+
+async def shutdown_shared_connector():
+    """공유 커넥터 종료 (앱 종료 시 호출)"""
+    global _global_connector
+
+    if _global_connector is not None:
+        await _global_connector.close()
+        _global_connector = None
+
+
 class KISAPIClient:
     """KIS Open API 클라이언트"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrent: int = 32,
+        rate_capacity: float = 20.0,
+        rate_refill: float = 10.0
+    ):
         self.settings = get_settings()
 
         # 모의투자 모드에 따른 URL 선택
@@ -51,13 +698,108 @@ class KISAPIClient:
         # 토큰 관리
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # 만료(5분 여유 포함)를 모노토닉 시각으로 캐싱 — 요청마다의 datetime 연산 제거
+        self._token_deadline_mono: Optional[float] = None
 
         # HTTP 세션
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Rate limiting (token bucket) - capacity까지 버스트 허용, 평균 속도는 refill로 제한
+        self._rate_capacity = rate_capacity
+        self._rate_refill = rate_refill  # 초당 토큰 보충량 (req/s)
+        self._rate_tokens = self._rate_capacity
+        self._rate_last_refill = 0.0
+        self._rate_lock = asyncio.Lock()
+
+        # 적응형 속도 조절 (AIMD): 성공 시 서서히 복원, 403/429 시 반감
+        self._rate_refill_max = rate_refill   # 설정 상한
+        self._rate_refill_min = 1.0           # 하한 (req/s)
+        self._rate_refill_step = 0.5          # 성공 시 가산량 (req/s)
+
+        # 토큰 발급 1분당 1회 제한용 슬라이딩 윈도우 (최근 60초 요청 시각)
+        self._token_window: deque = deque()
+        self._token_window_lock = asyncio.Lock()
+
+        # 동시 전송 중 요청 수 상한 (백프레셔): 커넥터 큐에 무한정 쌓이는 것 방지
+        self.max_concurrent = max_concurrent
+        self._inflight_sem = asyncio.Semaphore(max_concurrent)
+
+        # 멱등 GET 응답 단기 캐시: key -> (만료 시각, 응답)
+        self._response_cache: Dict[tuple, tuple] = {}
+
+        # 진행 중인 동일 GET 요청 병합용 (singleflight): key -> Future
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # 시장 지표 집계 결과 TTL 캐시 (다수 클라이언트의 대시보드 폴링 대응)
+        self._indicators_cache: Optional[tuple] = None  # (만료 시각, 값)
+        self._indicators_bytes: Optional[bytes] = None  # 캐시와 함께 갱신되는 직렬화 결과
+        self._indicators_lock = asyncio.Lock()
+
+        # 시장 상태 (개장 여부/세션/다음 개장) 초 단위 메모이즈: (초, 상태)
+        self._market_state_cache: Optional[tuple] = None
+
+        # 지수 응답 2차 캐시: (지수 코드, 분 버킷) -> 구조화 응답
+        # dict 삽입 순서를 이용한 FIFO 축출 (상한 초과 시 가장 오래된 항목 제거)
+        self._index_minute_cache: Dict[tuple, Dict[str, Any]] = {}
+
+        # 지표 주기 갱신/푸시 태스크 (클라이언트 폴링 대신 서버 푸시)
+        self._indicator_push_task: Optional[asyncio.Task] = None
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms minimum between requests
+        # 토큰 변경 시에만 재구성되는 기본 요청 헤더 캐시
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._cached_headers_token: Optional[str] = None
+
+        # 시뮬레이션 모드 플래그 — 매 호출의 getattr 기본값 조회 대신 1회 해석
+        # (pydantic 설정 객체의 속성 디스패치가 주문 핫패스에서 반복되지 않도록)
+        self._simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
+
+        # 시뮬레이션용 난수 풀 — numpy 배치 생성으로 채워 두고 하나씩 소비
+        self._rand_rng = np.random.default_rng()
+        self._rand_pool = self._rand_rng.random(self._RAND_POOL_SIZE)
+        self._rand_idx = 0
+
+        # 주문 경로 상수 (TR_ID/계좌 필드) — 모드 변경 시에만 재구성
+        self._refresh_order_constants()
+
+    # 난수 풀 크기 — 시뮬레이션 호출 1회당 4개 소비 기준 약 1천 호출 분량
+    _RAND_POOL_SIZE = 4096
+
+    def _next_rand(self) -> float:
+        """시뮬레이션용 [0, 1) 난수 반환 (풀 소진 시 배치 재충전)
+
+        호출마다 random.random()을 부르는 대신 numpy로 한 번에 생성한
+        풀에서 꺼내 쓴다 — 백테스트처럼 수천 회 호출되는 경로에서
+        파이썬 수준 난수 생성 오버헤드를 줄인다.
+        """
+        idx = self._rand_idx
+        if idx >= self._RAND_POOL_SIZE:
+            self._rand_pool = self._rand_rng.random(self._RAND_POOL_SIZE)
+            idx = 0
+        self._rand_idx = idx + 1
+        return self._rand_pool[idx]
+
+    def _refresh_order_constants(self):
+        """주문 헤더/계좌 고정 필드를 미리 조립 (주문마다 재구성하지 않음)
+
+        KIS는 WebSocket 주문 제출을 제공하지 않으므로 (WS는 시세/체결통보 전용)
+        주문은 keep-alive REST 경로를 유지하고, 대신 주문당 파이썬 오버헤드를
+        최소화한다.
+        """
+        self._order_headers_buy = {
+            "tr_id": "VTTC0802U" if self.is_mock_trading else "TTTC0802U"
+        }
+        self._order_headers_sell = {
+            "tr_id": "VTTC0801U" if self.is_mock_trading else "TTTC0801U"
+        }
+        self._order_base = {
+            "CANO": self.settings.KIS_ACCOUNT_NUMBER,          # 계좌번호
+            "ACNT_PRDT_CD": self.settings.KIS_ACCOUNT_PRODUCT_CODE  # 계좌상품코드
+        }
 
     async def __aenter__(self):
         """Async context manager 진입"""
@@ -70,34 +812,130 @@ class KISAPIClient:
 
     async def start(self):
         """클라이언트 시작 및 세션 초기화"""
+        # 이벤트 루프 캐싱 (rate limit 등 핫패스에서 loop.time() 사용)
+        self._loop = asyncio.get_running_loop()
+
         if self.session is None:
-            import ssl
-            # SSL 인증서 검증 우회 (개발 환경용)
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector
-            )
+            # 동시 start() 호출 시 참조 카운트가 중복 증가하지 않도록 보호
+            async with self._session_lock:
+                if self.session is None:
+                    # 세션/커넥션 풀 모두 모듈 전역으로 공유 (인스턴스는 참조만)
+                    self.session = _acquire_shared_session()
 
         # 저장된 토큰 로드 시도
         await self.load_stored_token()
 
         # 토큰 자동 갱신
         await self.ensure_valid_token()
+
+        # 만료 전 선제 갱신 태스크 예약
+        self._schedule_token_refresh()
+
+        # 커넥션 풀 예열 (시작 직후 첫 실요청의 핸드셰이크 지연 제거)
+        self._prewarm_task = asyncio.create_task(self._prewarm_connections())
+
+        # 유휴 커넥션 재활용 방지용 주기 핑
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
         logger.info("KIS API client started")
 
+    async def _prewarm_connections(self, count: int = 8):
+        """KIS 호스트로 커넥션을 미리 열어 풀을 예열
+
+        유휴 상태에서 풀이 비워진 뒤 첫 요청이 TCP+TLS 핸드셰이크를
+        다시 지불하는 것을 막는다. 응답 내용은 사용하지 않는다.
+        기본 8개는 지수/시세 fan-out(gather 3종 + _fanout 동시성 10)의
+        전형적인 폭을 따뜻한 커넥션으로 커버하는 수준 — aiohttp는
+        HTTP/2 멀티플렉싱을 지원하지 않으므로 병렬 요청은 커넥션
+        수로 흡수한다.
+        """
+        async def _open_one():
+            try:
+                async with self.session.head(
+                    f"{self.base_url}/", allow_redirects=False
+                ):
+                    pass
+            except Exception as e:
+                logger.debug(f"Connection pre-warm skipped: {e}")
+
+        await asyncio.gather(*(_open_one() for _ in range(count)))
+
+    # 핑 주기 (초) — 서버 측 유휴 타임아웃/중간 장비의 커넥션 회수보다 짧게
+    _KEEPALIVE_INTERVAL = 20.0
+
+    async def _keepalive_loop(self):
+        """유휴 커넥션이 식지 않도록 주기적으로 가벼운 HEAD 요청 전송
+
+        풀이 비워진 뒤의 첫 주문/시세 요청이 TCP+TLS 핸드셰이크를 다시
+        지불하면 수백 ms가 더 걸린다. 본문 없는 HEAD 핑으로 커넥션을
+        계속 데워 둔다. 실패는 무시 (다음 주기에 재시도).
+        """
+        while True:
+            await asyncio.sleep(self._KEEPALIVE_INTERVAL)
+            try:
+                async with self.session.head(
+                    f"{self.base_url}/", allow_redirects=False
+                ):
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Keep-alive ping failed: {e}")
+
     async def close(self):
         """세션 종료"""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+        if self._keepalive_task and not self._keepalive_task.done():
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
+        await self.stop_indicator_stream()
+
         if self.session:
-            await self.session.close()
+            # 공유 세션이므로 참조만 반환 (마지막 참조일 때만 실제 종료)
+            await _release_shared_session()
             self.session = None
         logger.info("KIS API client closed")
 
+    # 남은 수명의 90% 시점에 선제 갱신 — 만료 임박 전 여유를 두고 회전
+    _TOKEN_REFRESH_FACTOR = 0.9
+
+    def _schedule_token_refresh(self):
+        """남은 토큰 수명의 90% 경과 시점에 백그라운드 갱신 태스크 예약"""
+        if self.token_expires_at is None:
+            return
+
+        remaining = (self.token_expires_at - datetime.now()).total_seconds()
+        delay = remaining * self._TOKEN_REFRESH_FACTOR
+        if delay <= 0:
+            return
+
+        # 갱신 태스크 자신이 재예약하는 경우 스스로를 취소하지 않도록 주의
+        current = asyncio.current_task()
+        if (self._refresh_task and not self._refresh_task.done()
+                and self._refresh_task is not current):
+            self._refresh_task.cancel()
+
+        self._refresh_task = asyncio.create_task(self._auto_refresh(delay))
+
+    async def _auto_refresh(self, delay: float):
+        """만료 직전 토큰을 선제 갱신 (요청 경로의 동기 갱신 지연 제거)"""
+        try:
+            await asyncio.sleep(delay)
+            logger.info("Proactively refreshing KIS access token")
+            await self.get_access_token()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 실패해도 요청 경로의 ensure_valid_token이 안전망으로 남아 있음
+            logger.warning(f"Proactive token refresh failed: {e}")
+
     async def load_stored_token(self):
         """저장된 토큰 로드"""
         token_data = token_storage.load_token()
@@ -105,6 +943,7 @@ class KISAPIClient:
         if token_data and token_storage.is_token_valid(token_data):
             self.access_token = token_data.get("access_token")
             self.token_expires_at = token_data.get("token_expires_at")
+            self._update_token_deadline()
             logger.info("Loaded valid token from storage")
         else:
             logger.info("No valid stored token found")
@@ -119,12 +958,28 @@ class KISAPIClient:
             }
             token_storage.save_token(token_data)
 
+    def _update_token_deadline(self):
+        """토큰 만료를 loop.time() 기준 데드라인으로 변환해 캐싱"""
+        if self._loop is None or self.token_expires_at is None:
+            self._token_deadline_mono = None
+            return
+
+        remaining = (self.token_expires_at - datetime.now()).total_seconds()
+        self._token_deadline_mono = self._loop.time() + remaining - 300
+
     async def ensure_valid_token(self):
         """유효한 토큰 확보"""
+        # 핫패스: 캐싱된 모노토닉 데드라인만 비교 (datetime/timedelta 할당 없음)
+        if (self._token_deadline_mono is not None and
+                self.access_token is not None and
+                self._loop.time() < self._token_deadline_mono):
+            return
+
         # 토큰이 여전히 유효한지 확인
         if (self.access_token is not None and
             self.token_expires_at is not None and
             datetime.now() < self.token_expires_at - timedelta(minutes=5)):
+            self._update_token_deadline()
             logger.debug("Using existing valid token")
             return
 
@@ -135,6 +990,7 @@ class KISAPIClient:
         if (self.access_token is not None and
             self.token_expires_at is not None and
             datetime.now() < self.token_expires_at - timedelta(minutes=5)):
+            self._update_token_deadline()
             logger.info("Loaded valid token from storage")
             return
 
@@ -142,8 +998,38 @@ class KISAPIClient:
         logger.info("Need to request new token")
         await self.get_access_token()
 
+    # 토큰 발급 윈도우: 60초 동안 최대 1회 (KIS "1분당 1회" 제한)
+    _TOKEN_WINDOW_SECONDS = 60.0
+    _TOKEN_WINDOW_QUOTA = 1
+
+    async def _respect_token_quota(self):
+        """토큰 발급 전 슬라이딩 윈도우로 1분당 1회 제한을 선제 준수
+
+        사후 403 폴백에만 의존하지 않고, 윈도우가 찼으면 가장 오래된
+        요청이 60초를 벗어날 때까지 기다렸다가 발급을 시도한다.
+        락으로 전체 획득을 직렬화 — 만료 토큰을 동시에 만난 코루틴들이
+        같은 슬롯을 두 번 쓰거나 남의 타임스탬프를 pop하지 못하게 한다.
+        """
+        async with self._token_window_lock:
+            window = self._token_window
+            while True:
+                now = time.monotonic()
+                while window and now - window[0] >= self._TOKEN_WINDOW_SECONDS:
+                    window.popleft()
+
+                if len(window) < self._TOKEN_WINDOW_QUOTA:
+                    break
+
+                wait = self._TOKEN_WINDOW_SECONDS - (now - window[0])
+                logger.info(f"Token request window full; waiting {wait:.1f}s for 1/min quota")
+                await asyncio.sleep(wait)
+
+            window.append(time.monotonic())
+
     async def get_access_token(self) -> str:
         """OAuth 2.0 토큰 발급"""
+        await self._respect_token_quota()
+
         url = f"{self.base_url}/oauth2/tokenP"
 
         headers = {
@@ -160,7 +1046,8 @@ class KISAPIClient:
 
         async with self.session.post(url, headers=headers, json=data) as response:
             if response.status != 200:
-                error_text = await response.text()
+                # KIS는 항상 UTF-8 — aiohttp의 charset 탐지 경로를 거치지 않는다
+                error_text = (await response.read()).decode("utf-8", "replace")
 
                 # KIS API 제한 에러 (1분당 1회) 처리
                 if response.status == 403 and "1분당 1회" in error_text:
@@ -174,12 +1061,14 @@ class KISAPIClient:
                         self.token_expires_at = token_data.get("token_expires_at")
                         if isinstance(self.token_expires_at, str):
                             self.token_expires_at = datetime.fromisoformat(self.token_expires_at)
+                        self._update_token_deadline()
                         return self.access_token
 
                 logger.error(f"Token request failed: {response.status} - {error_text}")
                 raise Exception(f"Failed to get access token: {response.status}")
 
-            response_data = await response.json()
+            # bytes를 직접 C 파서로 처리 (str 왕복 없이)
+            response_data = orjson.loads(await response.read())
 
             # 응답 검증
             if "access_token" not in response_data:
@@ -190,69 +1079,267 @@ class KISAPIClient:
 
             self.access_token = token_info.access_token
             self.token_expires_at = datetime.now() + timedelta(seconds=token_info.expires_in)
+            self._update_token_deadline()
 
             # 토큰을 파일에 저장
             self.save_token_to_storage()
 
+            # 다음 선제 갱신 예약
+            self._schedule_token_refresh()
+
             logger.info(f"Access token obtained and saved, expires at: {self.token_expires_at}")
             return self.access_token
 
+    # GET 응답 캐시 상한 — 초과 시 만료 항목을 쓸어내고, 부족하면 FIFO 축출
+    _RESPONSE_CACHE_MAX = 256
+
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        base_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """KIS API 요청 실행
+
+        cache_ttl이 지정된 GET 요청은 해당 시간(초) 동안 응답을 재사용한다.
+        (변동 주기가 분/초 단위인 순위·지수 조회용)
+        동일 GET이 이미 진행 중이면 중복 요청 없이 그 결과를 공유한다.
+        base_url은 호출 단위 오버라이드 — 공유 상태를 건드리지 않으므로
+        gather로 동시 실행해도 안전하다.
+        """
+        request_key = None
+        if method == "GET" and data is None:
+            # 키는 실제 요청이 나가는 호스트 기준 — self.base_url을 쓰면
+            # 모의↔실전 전환 후 이전 호스트에서 받은 캐시/비행 항목이
+            # 남은 TTL 동안 교차 제공되는 것을 막는다
+            request_key = (
+                base_url or self.base_url,
+                endpoint,
+                tuple(sorted(params.items())) if params else None,
+                tuple(sorted(headers.items())) if headers else None
+            )
+
+        if cache_ttl and request_key is not None:
+            cached = self._response_cache.get(request_key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+        # Singleflight: 같은 요청이 비행 중이면 rate limit 토큰을 더 쓰지 않고 대기
+        flight_future = None
+        if request_key is not None:
+            existing = self._inflight.get(request_key)
+            if existing is not None:
+                # 한 대기자의 취소가 공유 중인 요청을 취소하지 않도록 shield
+                return await asyncio.shield(existing)
+
+            flight_future = self._loop.create_future()
+            # 대기자가 없어도 예외가 '미회수' 경고로 남지 않도록 즉시 회수
+            flight_future.add_done_callback(
+                lambda f: f.cancelled() or f.exception()
+            )
+            self._inflight[request_key] = flight_future
+
+        try:
+            response_data = await self._do_request(
+                method, endpoint, headers, params, data, base_url
+            )
+        except BaseException as e:
+            # CancelledError도 포함해야 한다 — 리더가 취소될 때 future를
+            # 해소하지 않으면 shield로 대기 중인 코루틴들이 영원히 걸린다
+            if flight_future is not None and not flight_future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    flight_future.cancel()
+                else:
+                    flight_future.set_exception(e)
+            raise
+        finally:
+            if request_key is not None:
+                self._inflight.pop(request_key, None)
+
+        if flight_future is not None and not flight_future.done():
+            flight_future.set_result(response_data)
+
+        if cache_ttl and request_key is not None:
+            cache = self._response_cache
+            if len(cache) >= self._RESPONSE_CACHE_MAX:
+                # 종목별 0.5초 TTL 키가 프로세스 수명 동안 쌓이지 않도록
+                # 상한 도달 시 만료 항목부터 제거
+                now = time.monotonic()
+                for key in [k for k, v in cache.items() if v[0] <= now]:
+                    del cache[key]
+                while len(cache) >= self._RESPONSE_CACHE_MAX:
+                    # dict 삽입 순서 = FIFO: 가장 오래된 항목부터 축출
+                    cache.pop(next(iter(cache)))
+            cache[request_key] = (time.monotonic() + cache_ttl, response_data)
+
+        return response_data
+
+    async def _do_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        base_url: Optional[str] = None
     ) -> Dict[str, Any]:
-        """KIS API 요청 실행"""
+        """단일 KIS API 요청 실행 (캐시/중복 병합은 _make_request가 담당)"""
         await self.ensure_valid_token()
         await self._rate_limit()
 
-        url = f"{self.base_url}{endpoint}"
+        url = f"{base_url or self.base_url}{endpoint}"
 
-        # 기본 헤더 설정
-        request_headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "Content-Type": "application/json; charset=utf-8"
-        }
+        # 기본 헤더는 토큰이 바뀔 때만 재구성 (Bearer 문자열 포함)
+        # 토큰은 문자열 재바인딩으로만 교체되므로 식별자 비교로 충분
+        if self._cached_headers_token is not self.access_token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+                "Content-Type": "application/json; charset=utf-8"
+            }
+            self._cached_headers_token = self.access_token
 
         if headers:
-            request_headers.update(headers)
+            request_headers = {**self._cached_headers, **headers}
+        else:
+            request_headers = self._cached_headers
 
         # 요청 실행
         logger.debug(f"Making {method} request to {endpoint}")
 
-        async with self.session.request(
-            method=method,
-            url=url,
-            headers=request_headers,
-            params=params,
-            json=data
-        ) as response:
-            response_text = await response.text()
+        # POST 본문은 orjson으로 미리 직렬화 (stdlib json.dumps 경로 우회)
+        # Content-Type은 기본 헤더에 이미 포함되어 있다
+        body = orjson.dumps(data) if data is not None else None
+
+        async with self._inflight_sem:
+            async with self.session.request(
+                method=method,
+                url=url,
+                headers=request_headers,
+                params=params,
+                data=body
+            ) as response:
+                status = response.status
+                raw = await response.read()
+
+        # 본문 수신 즉시 커넥션을 풀로 반환하고, 파싱은 커넥션 점유 없이 수행
+        # (거래량 순위 등 수백 KB 응답에서 파싱 시간만큼 커넥션이 묶이는 것 방지)
+        if status != 200:
+            if status in (403, 429):
+                # 서버가 제한 신호를 보내면 버스트를 비우고 속도를 낮춤
+                self._decrease_rate()
+            error_text = raw.decode("utf-8", "replace")
+            logger.error(f"API request failed: {status} - {error_text}")
+            raise Exception(f"API request failed: {status} - {error_text}")
+
+        # 성공 응답은 허용 속도를 상한까지 서서히 회복
+        self._increase_rate()
 
-            if response.status != 200:
-                logger.error(f"API request failed: {response.status} - {response_text}")
-                raise Exception(f"API request failed: {response.status} - {response_text}")
-
-            try:
-                return json.loads(response_text)
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON response: {response_text}")
-                raise Exception("Invalid JSON response from API")
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.error(f"Invalid JSON response: {raw[:512].decode('utf-8', 'replace')}")
+            raise Exception("Invalid JSON response from API")
 
     async def _rate_limit(self):
-        """Rate limiting 적용"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """Rate limiting 적용 (token bucket)"""
+        while True:
+            async with self._rate_lock:
+                # loop.time()은 모노토닉이라 NTP 보정으로 음수 간격이 생기지 않음
+                # (최초 호출은 elapsed가 커도 min이 capacity로 클램프)
+                now = self._loop.time()
+                elapsed = now - self._rate_last_refill
+                self._rate_tokens = min(
+                    self._rate_capacity,
+                    self._rate_tokens + elapsed * self._rate_refill
+                )
+                self._rate_last_refill = now
+
+                if self._rate_tokens >= 1.0:
+                    self._rate_tokens -= 1.0
+                    return
+
+                wait_time = (1.0 - self._rate_tokens) / self._rate_refill
+
+            # 락 밖에서 대기 후 재시도 (다른 코루틴의 토큰 보충을 막지 않음)
+            await asyncio.sleep(wait_time)
+
+    def _increase_rate(self):
+        """성공 응답 시 보충 속도를 설정 상한까지 가산 복원 (additive increase)"""
+        if self._rate_refill < self._rate_refill_max:
+            self._rate_refill = min(
+                self._rate_refill_max, self._rate_refill + self._rate_refill_step
+            )
 
-        if time_since_last < self.min_request_interval:
-            await asyncio.sleep(self.min_request_interval - time_since_last)
+    def _decrease_rate(self):
+        """403/429 수신 시 버스트를 비우고 보충 속도 반감 (multiplicative decrease)"""
+        self._rate_tokens = 0.0
+        self._rate_refill = max(self._rate_refill_min, self._rate_refill / 2.0)
+        logger.warning(
+            f"Rate limited by server; refill rate lowered to {self._rate_refill:.1f} req/s"
+        )
 
-        self.last_request_time = time.time()
+    async def _fanout(
+        self,
+        coro_fn: Callable,
+        args_list: List[tuple],
+        concurrency: int = 10
+    ) -> List[Any]:
+        """세마포어로 동시성을 제한한 병렬 요청 실행"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(args: tuple):
+            async with semaphore:
+                return await coro_fn(*args)
+
+        return await asyncio.gather(
+            *(_bounded(args) for args in args_list),
+            return_exceptions=True
+        )
+
+    async def gather_stocks(
+        self,
+        coro_fn: Callable,
+        stock_codes: List[str],
+        concurrency: int = 10
+    ) -> List[Any]:
+        """종목 코드 목록에 대한 per-symbol API 병렬 호출
+
+        결과는 입력 순서를 유지하며, 실패한 호출은 Exception 객체로 반환된다.
+        예) await client.gather_stocks(client.get_stock_detail, codes)
+        """
+        return await self._fanout(
+            coro_fn,
+            [(code,) for code in stock_codes],
+            concurrency=concurrency
+        )
+
+    async def fetch_many(
+        self,
+        coros: List[Any],
+        concurrency: int = 10
+    ) -> List[Any]:
+        """이미 만들어진 코루틴 목록을 동시성 제한 하에 병렬 실행
+
+        gather_stocks와 달리 임의 시그니처의 호출을 묶을 수 있다.
+        결과는 입력 순서를 유지하며, 실패는 Exception 객체로 반환된다.
+        예) await client.fetch_many([client.get_stock_detail(c) for c in codes])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _guard(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(
+            *(_guard(coro) for coro in coros),
+            return_exceptions=True
+        )
 
     # === Market Data APIs ===
 
@@ -271,7 +1358,7 @@ class KISAPIClient:
         # 방법 2: 시장별 조회 시도
         try:
             endpoint = "/uapi/domestic-stock/v1/quotations/inquire-daily-price"
-            headers = {"tr_id": "FHKST01010400"}
+            headers = {"tr_id": _TR_DAILY_PRICE}
             params = {
                 "FID_COND_MRKT_DIV_CODE": "J",
                 "FID_INPUT_ISCD": "0001",
@@ -297,206 +1384,63 @@ class KISAPIClient:
 
         # Mock 모드에서만 기본 주식 목록 반환
         logger.warning("🎮 Mock mode: Using fallback hardcoded stock list")
-        return [
-            {"mksc_shrn_iscd": "005930", "hts_kor_isnm": "삼성전자 (Mock)"},
-            {"mksc_shrn_iscd": "000660", "hts_kor_isnm": "SK하이닉스 (Mock)"},
-            {"mksc_shrn_iscd": "035420", "hts_kor_isnm": "NAVER (Mock)"},
-            {"mksc_shrn_iscd": "051910", "hts_kor_isnm": "LG화학 (Mock)"},
-            {"mksc_shrn_iscd": "006400", "hts_kor_isnm": "삼성SDI (Mock)"}
-        ]
+        return [dict(row) for row in _FALLBACK_BASIC_STOCKS]
 
-    async def get_stock_detail(self, stock_code: str) -> Dict[str, Any]:
-        """개별 주식 상세 정보 조회"""
-        endpoint = "/uapi/domestic-stock/v1/quotations/inquire-price"
+    # 종목 코드 하나만 바뀌는 엔드포인트는 쿼리스트링을 미리 조립
+    # (per-ticker 팬아웃 시 dict 생성 + urlencode + MultiDict 변환 생략)
+    _QS_PRICE = "/uapi/domestic-stock/v1/quotations/inquire-price?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD="
+    _QS_AFTER_HOURS = "/uapi/domestic-stock/v1/quotations/inquire-after-hours-quote?FID_COND_MRKT_DIV_CODE=J&FID_INPUT_ISCD="
 
+    async def get_stock_detail(self, stock_code: str, cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+        """개별 주식 상세 정보 조회"""
         headers = {
-            "tr_id": "FHKST01010100"
-        }
-
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": stock_code
+            "tr_id": _TR_STOCK_PRICE
         }
 
-        response = await self._make_request("GET", endpoint, headers=headers, params=params)
+        response = await self._make_request(
+            "GET", self._QS_PRICE + stock_code, headers=headers, cache_ttl=cache_ttl
+        )
         return response.get("output", {})
 
     async def get_after_hours_price(self, stock_code: str) -> Dict[str, Any]:
         """시간외 호가 조회 (16:00-17:40)"""
-        endpoint = "/uapi/domestic-stock/v1/quotations/inquire-after-hours-quote"
-
         headers = {
-            "tr_id": "FHKST01010200"
+            "tr_id": _TR_AFTER_HOURS
         }
 
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": stock_code
-        }
-
-        response = await self._make_request("GET", endpoint, headers=headers, params=params)
+        response = await self._make_request(
+            "GET", self._QS_AFTER_HOURS + stock_code, headers=headers
+        )
         return response.get("output", {})
 
-    async def get_market_indices(self) -> Dict[str, Any]:
-        """KOSPI/KOSDAQ 시장 지수 데이터 조회"""
-        try:
-            indices_data = {}
-
-            # KOSPI 조회
-            kospi_data = await self._get_index_price("0001", "KOSPI")
-            if kospi_data:
-                indices_data["kospi"] = kospi_data
-
-            # KOSDAQ 조회
-            kosdaq_data = await self._get_index_price("1001", "KOSDAQ")
-            if kosdaq_data:
-                indices_data["kosdaq"] = kosdaq_data
-
-            indices_data["timestamp"] = datetime.now().isoformat()
-
-            return indices_data
-
-        except Exception as e:
-            logger.error(f"Failed to get market indices: {e}")
-            return {"error": str(e)}
-
-    async def get_index_price(self, index_code: str) -> Optional[Dict[str, Any]]:
-        """개별 지수 가격 조회 (public method)"""
-        index_names = {
-            "0001": "KOSPI",
-            "1001": "KOSDAQ",
-            "2001": "KOSPI200"
-        }
-        index_name = index_names.get(index_code, f"Index_{index_code}")
-        return await self._get_index_price(index_code, index_name)
-
-    async def _get_index_price(self, index_code: str, index_name: str) -> Optional[Dict[str, Any]]:
-        """내부 지수 가격 조회 메서드"""
-        try:
-            # 모의투자 모드에서는 가짜 데이터 반환
-            if self.is_mock_trading:
-                return self._generate_mock_index_data(index_code, index_name)
-
-            # 실제 KIS API 호출
-            endpoint = "/uapi/domestic-stock/v1/quotations/inquire-index-price"
-
-            headers = {
-                "tr_id": "FHPST01010000"
-            }
-
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "U",
-                "FID_INPUT_ISCD": index_code
-            }
-
-            response = await self._make_request("GET", endpoint, headers=headers, params=params)
-
-            if response and "output" in response:
-                data = response["output"]
-
-                return {
-                    "index_code": index_code,
-                    "index_name": index_name,
-                    "current_price": float(data.get("bstp_nmix_prpr", 0)),
-                    "price_change": float(data.get("bstp_nmix_prdy_vrss", 0)),
-                    "change_rate": float(data.get("prdy_ctrt", 0)),
-                    "trading_volume": int(data.get("acml_vol", 0)),
-                    "timestamp": datetime.now().isoformat()
-                }
-
-        except Exception as e:
-            logger.warning(f"Failed to get {index_name} price: {e}")
-            # 실패 시 모의 데이터 반환
-            return self._generate_mock_index_data(index_code, index_name)
-
-        return None
-
-    def _generate_mock_index_data(self, index_code: str, index_name: str) -> Dict[str, Any]:
-        """모의투자용 가짜 지수 데이터 생성"""
-        import random
-
-        base_prices = {
-            "0001": 3200,  # KOSPI
-            "1001": 1000,  # KOSDAQ
-            "2001": 430    # KOSPI200
-        }
-
-        base_price = base_prices.get(index_code, 2500)
-        current_price = base_price + random.uniform(-50, 50)
-        price_change = random.uniform(-30, 30)
-        change_rate = (price_change / base_price) * 100
-
-        return {
-            "index_code": index_code,
-            "index_name": f"{index_name} (Mock)",
-            "current_price": round(current_price, 2),
-            "price_change": round(price_change, 2),
-            "change_rate": round(change_rate, 2),
-            "trading_volume": random.randint(100000000, 500000000),
-            "timestamp": datetime.now().isoformat()
-        }
-
     async def get_stock_volume_ranking(self, market_div: str = "J") -> List[Dict[str, Any]]:
         """거래량 순위 조회 (모의투자/실거래 모드에 따라 해당 데이터 반환)"""
 
         # 모의투자 모드에서는 거래량순위 API가 지원되지 않음
         if self.is_mock_trading:
             logger.info("🎮 Mock trading mode: Volume ranking API not supported, using fallback data")
-            return [
-                {
-                    "mksc_shrn_iscd": "005930",
-                    "hts_kor_isnm": "삼성전자 (Mock)",
-                    "stck_prpr": "79700",
-                    "acml_vol": "20898386",
-                    "prdy_ctrt": "-0.99"
-                },
-                {
-                    "mksc_shrn_iscd": "000660",
-                    "hts_kor_isnm": "SK하이닉스 (Mock)",
-                    "stck_prpr": "353000",
-                    "acml_vol": "4385543",
-                    "prdy_ctrt": "0.00"
-                },
-                {
-                    "mksc_shrn_iscd": "035720",
-                    "hts_kor_isnm": "카카오 (Mock)",
-                    "stck_prpr": "67000",
-                    "acml_vol": "5009911",
-                    "prdy_ctrt": "3.55"
-                }
-            ]
+            return [dict(row) for row in _MOCK_VOLUME_RANKING]
 
         # 실거래 모드에서만 실제 KIS API 호출
         endpoint = "/uapi/domestic-stock/v1/quotations/volume-rank"
 
         headers = {
-            "tr_id": "FHPST01710000"  # 올바른 실전 TR_ID
+            "tr_id": _TR_VOLUME_RANK  # 올바른 실전 TR_ID
         }
 
-        params = {
-            "FID_COND_MRKT_DIV_CODE": market_div,
-            "FID_COND_SCR_DIV_CODE": "20171",  # 올바른 화면번호
-            "FID_INPUT_ISCD": "0000",
-            "FID_DIV_CLS_CODE": "0",
-            "FID_BLNG_CLS_CODE": "0",
-            "FID_TRGT_CLS_CODE": "111111111",
-            "FID_TRGT_EXLS_CLS_CODE": "000000",
-            "FID_INPUT_PRICE_1": "0",  # 빈 문자열 대신 "0"
-            "FID_INPUT_PRICE_2": "0",  # 빈 문자열 대신 "0"
-            "FID_VOL_CNT": "0",        # 1000 대신 "0"
-            "FID_INPUT_DATE_1": "0"    # 누락된 필수 파라미터 추가
-        }
+        params = dict(_PARAMS_VOLUME_RANK, FID_COND_MRKT_DIV_CODE=market_div)
 
         trading_mode = "🎮 Mock" if self.is_mock_trading else "💰 Real"
         logger.info(f"{trading_mode} Volume ranking requested for market {market_div}")
 
         try:
-            response = await self._make_request("GET", endpoint, headers=headers, params=params)
+            response = await self._make_request(
+                "GET", endpoint, headers=headers, params=params, cache_ttl=5.0
+            )
 
             # KIS API 응답 구조 확인
-            logger.info(f"{trading_mode} Volume ranking raw response type: {type(response)}")
-            if isinstance(response, dict) and len(str(response)) < 500:
-                logger.info(f"{trading_mode} Volume ranking raw response: {response}")
+            # 전체 응답 덤프는 DEBUG에서만 — str() 직렬화 비용이 응답 크기에 비례
+            logger.debug("Volume ranking raw response", mode=trading_mode, response=response)
 
             # KIS API는 보통 output1, output2 등으로 구분된 응답을 제공
             if isinstance(response, dict):
@@ -516,78 +1460,7 @@ class KISAPIClient:
 
         # Enhanced fallback based on trading mode
         logger.info(f"{trading_mode} Providing fallback volume ranking data")
-        return [
-            {
-                "mksc_shrn_iscd": "005930",
-                "hts_kor_isnm": "삼성전자",
-                "stck_prpr": "79700",
-                "acml_vol": "20898386",
-                "prdy_ctrt": "-0.99"
-            },
-            {
-                "mksc_shrn_iscd": "000660",
-                "hts_kor_isnm": "SK하이닉스",
-                "stck_prpr": "353000",
-                "acml_vol": "4385543",
-                "prdy_ctrt": "0.00"
-            },
-            {
-                "mksc_shrn_iscd": "035720",
-                "hts_kor_isnm": "카카오",
-                "stck_prpr": "67000",
-                "acml_vol": "5009911",
-                "prdy_ctrt": "3.55"
-            },
-            {
-                "mksc_shrn_iscd": "035420",
-                "hts_kor_isnm": "NAVER",
-                "stck_prpr": "234000",
-                "acml_vol": "1585243",
-                "prdy_ctrt": "-1.89"
-            },
-            {
-                "mksc_shrn_iscd": "005380",
-                "hts_kor_isnm": "현대차",
-                "stck_prpr": "214000",
-                "acml_vol": "1301527",
-                "prdy_ctrt": "-2.06"
-            },
-            {
-                "mksc_shrn_iscd": "000270",
-                "hts_kor_isnm": "기아",
-                "stck_prpr": "101600",
-                "acml_vol": "1545375",
-                "prdy_ctrt": "-0.49"
-            },
-            {
-                "mksc_shrn_iscd": "006400",
-                "hts_kor_isnm": "삼성SDI",
-                "stck_prpr": "203000",
-                "acml_vol": "858121",
-                "prdy_ctrt": "-2.87"
-            },
-            {
-                "mksc_shrn_iscd": "051910",
-                "hts_kor_isnm": "LG화학",
-                "stck_prpr": "291000",
-                "acml_vol": "343090",
-                "prdy_ctrt": "-3.32"
-            },
-            {
-                "mksc_shrn_iscd": "068270",
-                "hts_kor_isnm": "셀트리온",
-                "stck_prpr": "170800",
-                "acml_vol": "457846",
-                "prdy_ctrt": "1.36"
-            },
-            {
-                "mksc_shrn_iscd": "207940",
-                "hts_kor_isnm": "삼성바이오로직스",
-                "stck_prpr": "1024000",
-                "acml_vol": "91201",
-                "prdy_ctrt": "-0.49"
-            }
-        ]
+        return [dict(row) for row in _FALLBACK_VOLUME_RANKING]
 
     async def get_stock_return_ranking(self, market_div: str = "J") -> List[Dict[str, Any]]:
         """등락률 순위 조회 (수익률 기준 내림차순) - Top Stocks용"""
@@ -595,56 +1468,16 @@ class KISAPIClient:
         # 모의투자 모드에서는 등락률순위 API가 지원되지 않음
         if self.is_mock_trading:
             logger.info("🎮 Mock trading mode: Return ranking API not supported, using fallback data")
-            return [
-                {
-                    "stck_shrn_iscd": "000040",
-                    "hts_kor_isnm": "KR모터스 (Mock)",
-                    "stck_prpr": "1821",
-                    "prdy_ctrt": "12.13",
-                    "acml_vol": "2267183",
-                    "data_rank": "1"
-                },
-                {
-                    "stck_shrn_iscd": "032800",
-                    "hts_kor_isnm": "판타지오 (Mock)",
-                    "stck_prpr": "406",
-                    "prdy_ctrt": "22.66",
-                    "acml_vol": "36313396",
-                    "data_rank": "2"
-                },
-                {
-                    "stck_shrn_iscd": "018000",
-                    "hts_kor_isnm": "유니슨 (Mock)",
-                    "stck_prpr": "1233",
-                    "prdy_ctrt": "21.12",
-                    "acml_vol": "2436474",
-                    "data_rank": "3"
-                }
-            ]
+            return [dict(row) for row in _MOCK_RETURN_RANKING]
 
         # 실거래 모드에서만 실제 KIS API 호출
         endpoint = "/uapi/domestic-stock/v1/ranking/fluctuation"
 
         headers = {
-            "tr_id": "FHPST01700000"  # 등락률 순위 TR_ID
+            "tr_id": _TR_RETURN_RANK  # 등락률 순위 TR_ID
         }
 
-        params = {
-            "fid_cond_mrkt_div_code": market_div,
-            "fid_cond_scr_div_code": "20170",  # 등락률 순위 화면 코드
-            "fid_input_iscd": "0000",          # 전체
-            "fid_rank_sort_cls_code": "0",     # 0:상승율순 (내림차순)
-            "fid_input_cnt_1": "0",            # 전체
-            "fid_prc_cls_code": "0",           # 전체
-            "fid_input_price_1": "",           # 공백
-            "fid_input_price_2": "",           # 공백
-            "fid_vol_cnt": "",                 # 공백
-            "fid_trgt_cls_code": "0",          # 전체
-            "fid_trgt_exls_cls_code": "0",     # 전체
-            "fid_div_cls_code": "0",           # 전체
-            "fid_rsfl_rate1": "",              # 공백
-            "fid_rsfl_rate2": ""               # 공백
-        }
+        params = dict(_PARAMS_RETURN_RANK, fid_cond_mrkt_div_code=market_div)
 
         trading_mode = "🎮 Mock" if self.is_mock_trading else "💰 Real"
         logger.info(f"{trading_mode} Return ranking (등락률순) requested for market {market_div}")
@@ -653,9 +1486,8 @@ class KISAPIClient:
             response = await self._make_request("GET", endpoint, headers=headers, params=params)
 
             # KIS API 응답 구조 확인
-            logger.info(f"{trading_mode} Return ranking raw response type: {type(response)}")
-            if isinstance(response, dict) and len(str(response)) < 500:
-                logger.info(f"{trading_mode} Return ranking raw response: {response}")
+            # 전체 응답 덤프는 DEBUG에서만 — str() 직렬화 비용이 응답 크기에 비례
+            logger.debug("Return ranking raw response", mode=trading_mode, response=response)
 
             # KIS API는 보통 output으로 응답을 제공
             if isinstance(response, dict):
@@ -672,95 +1504,14 @@ class KISAPIClient:
 
         # Enhanced fallback based on trading mode
         logger.info(f"{trading_mode} Providing fallback return ranking data")
-        return [
-            {
-                "stck_shrn_iscd": "000040",
-                "hts_kor_isnm": "KR모터스",
-                "stck_prpr": "1821",
-                "prdy_ctrt": "12.13",
-                "acml_vol": "2267183",
-                "data_rank": "1"
-            },
-            {
-                "stck_shrn_iscd": "032800",
-                "hts_kor_isnm": "판타지오",
-                "stck_prpr": "406",
-                "prdy_ctrt": "22.66",
-                "acml_vol": "36313396",
-                "data_rank": "2"
-            },
-            {
-                "stck_shrn_iscd": "018000",
-                "hts_kor_isnm": "유니슨",
-                "stck_prpr": "1233",
-                "prdy_ctrt": "21.12",
-                "acml_vol": "2436474",
-                "data_rank": "3"
-            },
-            {
-                "stck_shrn_iscd": "083790",
-                "hts_kor_isnm": "CG인바이츠",
-                "stck_prpr": "4025",
-                "prdy_ctrt": "19.08",
-                "acml_vol": "1666447",
-                "data_rank": "4"
-            },
-            {
-                "stck_shrn_iscd": "237690",
-                "hts_kor_isnm": "에스티팜",
-                "stck_prpr": "93400",
-                "prdy_ctrt": "20.36",
-                "acml_vol": "1368523",
-                "data_rank": "5"
-            },
-            {
-                "stck_shrn_iscd": "065150",
-                "hts_kor_isnm": "대산F&B",
-                "stck_prpr": "239",
-                "prdy_ctrt": "16.02",
-                "acml_vol": "5046848",
-                "data_rank": "6"
-            },
-            {
-                "stck_shrn_iscd": "008600",
-                "hts_kor_isnm": "윌비스",
-                "stck_prpr": "596",
-                "prdy_ctrt": "12.45",
-                "acml_vol": "3819993",
-                "data_rank": "7"
-            },
-            {
-                "stck_shrn_iscd": "219130",
-                "hts_kor_isnm": "타이거일렉",
-                "stck_prpr": "37700",
-                "prdy_ctrt": "14.24",
-                "acml_vol": "188206",
-                "data_rank": "8"
-            },
-            {
-                "stck_shrn_iscd": "004380",
-                "hts_kor_isnm": "삼익THK",
-                "stck_prpr": "17290",
-                "prdy_ctrt": "13.82",
-                "acml_vol": "2290984",
-                "data_rank": "9"
-            },
-            {
-                "stck_shrn_iscd": "321370",
-                "hts_kor_isnm": "센서뷰",
-                "stck_prpr": "5020",
-                "prdy_ctrt": "22.44",
-                "acml_vol": "4923442",
-                "data_rank": "10"
-            }
-        ]
+        return [dict(row) for row in _FALLBACK_RETURN_RANKING]
 
     async def get_intraday_chart(self, stock_code: str, time_unit: str = "1") -> List[Dict[str, Any]]:
         """분봉 차트 데이터 조회 (시간대별 데이터)"""
         endpoint = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
 
         headers = {
-            "tr_id": "FHKST03010200"
+            "tr_id": _TR_MINUTE_CHART
         }
 
         params = {
@@ -779,7 +1530,7 @@ class KISAPIClient:
         endpoint = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
 
         headers = {
-            "tr_id": "FHKST03010100"
+            "tr_id": _TR_DAILY_CHART
         }
 
         params = {
@@ -795,7 +1546,10 @@ class KISAPIClient:
         return response.get("output2", [])
 
     async def get_minute_data_for_momentum(self, stock_code: str) -> Dict[str, Any]:
-        """모멘텀 분석용 분봉 데이터 조회 (후반부 상승률 계산용)"""
+        """모멘텀 분석용 분봉 데이터 조회 (후반부 상승률 계산용)
+
+        I/O(차트 조회)만 담당하고 계산은 순수 함수 _compute_momentum에 위임한다.
+        """
         try:
             # 1분봉 데이터 조회 (최근 100개)
             minute_data = await self.get_intraday_chart(stock_code, "1")
@@ -803,67 +1557,7 @@ class KISAPIClient:
             if not minute_data:
                 return {"error": "No minute data available"}
 
-            # 14:00-15:30 시간대 필터링 및 분석
-            late_session_data = []
-            total_volume = 0
-            late_session_volume = 0
-
-            # 데이터를 시간순으로 정렬 (최신 → 과거 순이므로 역순 필요)
-            minute_data_sorted = sorted(minute_data, key=lambda x: x.get('stck_cntg_hour', ''))
-
-            for candle in minute_data_sorted:
-                hour_time = candle.get('stck_cntg_hour', '')  # HHMMSS 형식
-                price = float(candle.get('stck_prpr', 0))
-                volume = int(candle.get('cntg_vol', 0))
-
-                total_volume += volume
-
-                # 14:00-15:30 시간대 체크 (140000-153000)
-                if hour_time >= '140000' and hour_time <= '153000':
-                    late_session_data.append({
-                        'time': hour_time,
-                        'price': price,
-                        'volume': volume
-                    })
-                    late_session_volume += volume
-
-            # 후반부 상승률 계산
-            late_session_return = 0.0
-            if late_session_data and len(late_session_data) >= 2:
-                start_price = late_session_data[0]['price']  # 14:00 가격
-                end_price = late_session_data[-1]['price']   # 15:30 가격
-
-                if start_price > 0:
-                    late_session_return = ((end_price - start_price) / start_price) * 100
-
-            # 후반부 거래량 비중 계산
-            late_volume_ratio = 0.0
-            if total_volume > 0:
-                late_volume_ratio = (late_session_volume / total_volume) * 100
-
-            # VWAP 계산 (거래량 가중 평균가)
-            total_price_volume = 0
-            total_volume_for_vwap = 0
-
-            for candle in minute_data_sorted:
-                price = float(candle.get('stck_prpr', 0))
-                volume = int(candle.get('cntg_vol', 0))
-
-                total_price_volume += price * volume
-                total_volume_for_vwap += volume
-
-            vwap = 0.0
-            if total_volume_for_vwap > 0:
-                vwap = total_price_volume / total_volume_for_vwap
-
-            return {
-                'late_session_return': late_session_return,
-                'late_session_volume_ratio': late_volume_ratio,
-                'vwap': vwap,
-                'total_volume': total_volume,
-                'late_session_volume': late_session_volume,
-                'data_points': len(minute_data)
-            }
+            return _compute_momentum(minute_data)
 
         except Exception as e:
             logger.warning(f"Error getting minute data for {stock_code}: {str(e)}")
@@ -872,12 +1566,21 @@ class KISAPIClient:
     async def get_market_index_data(self) -> Dict[str, Any]:
         """시장 지수 데이터 조회 (코스피, 코스닥)"""
         try:
-            # 코스피 지수 조회
-            kospi_data = await self.get_stock_detail("0001")  # 코스피 지수 코드
-            kosdaq_data = await self.get_stock_detail("1001")  # 코스닥 지수 코드
+            # 코스피/코스닥 지수 동시 조회 (순차 호출 대비 왕복 지연 절반)
+            kospi_data, kosdaq_data = await asyncio.gather(
+                self.get_stock_detail("0001", cache_ttl=10.0),  # 코스피 지수 코드
+                self.get_stock_detail("1001", cache_ttl=10.0),  # 코스닥 지수 코드
+                return_exceptions=True
+            )
+            if isinstance(kospi_data, BaseException):
+                logger.warning(f"KOSPI index fetch failed: {kospi_data}")
+                kospi_data = None
+            if isinstance(kosdaq_data, BaseException):
+                logger.warning(f"KOSDAQ index fetch failed: {kosdaq_data}")
+                kosdaq_data = None
 
-            kospi_return = float(kospi_data.get('prdy_ctrt', 0)) if kospi_data else 0
-            kosdaq_return = float(kosdaq_data.get('prdy_ctrt', 0)) if kosdaq_data else 0
+            kospi_return = _to_float(kospi_data, 'prdy_ctrt') if kospi_data else 0
+            kosdaq_return = _to_float(kosdaq_data, 'prdy_ctrt') if kosdaq_data else 0
 
             return {
                 'kospi_return': kospi_return,
@@ -895,6 +1598,21 @@ class KISAPIClient:
 
     # === Trading APIs ===
 
+    def _sim_order_response(self) -> Dict[str, Any]:
+        """시뮬레이션 주문 응답 생성 — 정적 골격은 모듈 템플릿을 공유
+
+        백테스트처럼 시뮬레이션 주문이 수천 건 발생하는 경로에서
+        호출당 중첩 dict 전체를 새로 만들지 않고 동적 필드만 조립한다.
+        주문번호는 time_ns()로 생성 (float 변환 없는 단조 증가 값).
+        """
+        out = dict(_SIM_ORDER_SKEL)
+        out["output"] = {
+            "KRX_FWDG_ORD_ORGNO": "",
+            "ODNO": f"SIM{time.time_ns()}",  # 시뮬레이션 주문번호
+            "ORD_TMD": datetime.now().strftime("%H%M%S")
+        }
+        return out
+
     async def place_buy_order(
         self,
         stock_code: str,
@@ -905,32 +1623,14 @@ class KISAPIClient:
         """매수 주문 실행"""
 
         # 모의투자 시뮬레이션 모드 - API 연결 없이 테스트 (개발 환경)
-        simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
-        if self.is_mock_trading and simulation_mode:
+        if self.is_mock_trading and self._simulation_mode:
             logger.info(f"🎮 SIMULATION: Buy order {stock_code}, qty: {quantity}, price: {price}")
-            return {
-                "rt_cd": "0",  # 성공 코드
-                "msg_cd": "MCA00000",
-                "msg1": "주문이 완료되었습니다.",
-                "output": {
-                    "KRX_FWDG_ORD_ORGNO": "",
-                    "ODNO": f"SIM{int(time.time())}",  # 시뮬레이션 주문번호
-                    "ORD_TMD": datetime.now().strftime("%H%M%S")
-                }
-            }
+            return self._sim_order_response()
 
         endpoint = "/uapi/domestic-stock/v1/trading/order-cash"
 
-        # 모의투자 vs 실거래 TR ID 선택
-        tr_id = "VTTC0802U" if self.is_mock_trading else "TTTC0802U"
-
-        headers = {
-            "tr_id": tr_id
-        }
-
         data = {
-            "CANO": self.settings.KIS_ACCOUNT_NUMBER,  # 계좌번호
-            "ACNT_PRDT_CD": self.settings.KIS_ACCOUNT_PRODUCT_CODE,  # 계좌상품코드
+            **self._order_base,
             "PDNO": stock_code,
             "ORD_DVSN": order_type,
             "ORD_QTY": str(quantity),
@@ -938,7 +1638,9 @@ class KISAPIClient:
         }
 
         logger.info(f"Placing buy order: {stock_code}, qty: {quantity}, price: {price}")
-        response = await self._make_request("POST", endpoint, headers=headers, data=data)
+        response = await self._make_request(
+            "POST", endpoint, headers=self._order_headers_buy, data=data
+        )
         return response
 
     async def place_sell_order(
@@ -951,32 +1653,14 @@ class KISAPIClient:
         """매도 주문 실행"""
 
         # 모의투자 시뮬레이션 모드 - API 연결 없이 테스트 (개발 환경)
-        simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
-        if self.is_mock_trading and simulation_mode:
+        if self.is_mock_trading and self._simulation_mode:
             logger.info(f"🎮 SIMULATION: Sell order {stock_code}, qty: {quantity}, price: {price}")
-            return {
-                "rt_cd": "0",  # 성공 코드
-                "msg_cd": "MCA00000",
-                "msg1": "주문이 완료되었습니다.",
-                "output": {
-                    "KRX_FWDG_ORD_ORGNO": "",
-                    "ODNO": f"SIM{int(time.time())}",  # 시뮬레이션 주문번호
-                    "ORD_TMD": datetime.now().strftime("%H%M%S")
-                }
-            }
+            return self._sim_order_response()
 
         endpoint = "/uapi/domestic-stock/v1/trading/order-cash"
 
-        # 모의투자 vs 실거래 TR ID 선택
-        tr_id = "VTTC0801U" if self.is_mock_trading else "TTTC0801U"
-
-        headers = {
-            "tr_id": tr_id
-        }
-
         data = {
-            "CANO": self.settings.KIS_ACCOUNT_NUMBER,  # 계좌번호
-            "ACNT_PRDT_CD": self.settings.KIS_ACCOUNT_PRODUCT_CODE,
+            **self._order_base,
             "PDNO": stock_code,
             "ORD_DVSN": order_type,
             "ORD_QTY": str(quantity),
@@ -984,44 +1668,78 @@ class KISAPIClient:
         }
 
         logger.info(f"Placing sell order: {stock_code}, qty: {quantity}, price: {price}")
-        response = await self._make_request("POST", endpoint, headers=headers, data=data)
+        response = await self._make_request(
+            "POST", endpoint, headers=self._order_headers_sell, data=data
+        )
         return response
 
+    # 현재가 캐시 TTL (초) — 포지션 평가/주문 가격 산정이 같은 종목을
+    # 짧은 간격으로 중복 조회할 때 네트워크 호출을 1회로 합치는 용도
+    _PRICE_CACHE_TTL = 0.5
+
     async def get_current_price(self, stock_code: str) -> Dict[str, Any]:
-        """현재 주가 조회"""
+        """현재 주가 조회 (0.5초 TTL 캐시 + 진행 중 요청 병합)"""
 
         # 모의투자 시뮬레이션 모드 - API 연결 없이 테스트 (개발 환경)
-        simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
-        if self.is_mock_trading and simulation_mode:
-            import random
+        if self.is_mock_trading and self._simulation_mode:
             # 시뮬레이션 가격 생성 (50,000 ~ 150,000 범위)
-            base_price = 100000 + random.randint(-50000, 50000)
+            # 난수 풀에서 4개 소비 + 산술로 구성 — randint/uniform 호출 오버헤드 회피
+            base_price = 50000 + int(self._next_rand() * 100000)
             logger.info(f"🎮 SIMULATION: Current price for {stock_code}: ₩{base_price:,}")
             return {
                 "rt_cd": "0",
                 "output": {
                     "stck_prpr": str(base_price),  # 현재가
-                    "prdy_vrss": str(random.randint(-5000, 5000)),  # 전일 대비
-                    "prdy_ctrt": f"{random.uniform(-5.0, 5.0):.2f}",  # 전일 대비율
-                    "acml_vol": str(random.randint(100000, 1000000))  # 누적 거래량
+                    "prdy_vrss": str(int(self._next_rand() * 10000) - 5000),  # 전일 대비
+                    "prdy_ctrt": f"{(self._next_rand() - 0.5) * 10.0:.2f}",  # 전일 대비율
+                    "acml_vol": str(100000 + int(self._next_rand() * 900000))  # 누적 거래량
                 }
             }
 
-        endpoint = "/uapi/domestic-stock/v1/quotations/inquire-price"
-
         headers = {
-            "tr_id": "FHKST01010100"
-        }
-
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": stock_code
+            "tr_id": _TR_STOCK_PRICE
         }
 
         logger.info(f"Getting current price for: {stock_code}")
-        response = await self._make_request("GET", endpoint, headers=headers, params=params)
+        response = await self._make_request(
+            "GET", self._QS_PRICE + stock_code, headers=headers,
+            cache_ttl=self._PRICE_CACHE_TTL
+        )
         return response
 
+    async def get_current_prices_batch(self, stock_codes: List[str]) -> List[Dict[str, Any]]:
+        """복수 종목 현재가 일괄 조회 (관심종목 멀티시세, 호출당 최대 20종목)
+
+        per-symbol 조회 대비 요청 수를 배치 크기만큼 줄여 분당 쿼터 소모를 낮춘다.
+        """
+        if not stock_codes:
+            return []
+
+        endpoint = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        headers = {"tr_id": _TR_PRICE_BATCH}
+
+        async def _fetch_chunk(chunk: tuple) -> List[Dict[str, Any]]:
+            params = {}
+            for i, code in enumerate(chunk, start=1):
+                params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
+                params[f"FID_INPUT_ISCD_{i}"] = code
+
+            response = await self._make_request("GET", endpoint, headers=headers, params=params)
+            output = response.get("output") or []
+            return output if isinstance(output, list) else [output]
+
+        chunks = [tuple(stock_codes[i:i + 20]) for i in range(0, len(stock_codes), 20)]
+        results = await self._fanout(_fetch_chunk, [(chunk,) for chunk in chunks])
+
+        merged: List[Dict[str, Any]] = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Batch price chunk failed: {result}")
+                continue
+            merged.extend(result)
+
+        return merged
+
     async def get_account_balance(self) -> Dict[str, Any]:
         """계좌 잔고 조회"""
         endpoint = "/uapi/domestic-stock/v1/trading/inquire-balance"
@@ -1034,8 +1752,7 @@ class KISAPIClient:
         }
 
         params = {
-            "CANO": self.settings.KIS_ACCOUNT_NUMBER,  # 계좌번호
-            "ACNT_PRDT_CD": self.settings.KIS_ACCOUNT_PRODUCT_CODE,
+            **self._order_base,  # 계좌번호/계좌상품코드 (미리 조립된 상수)
             "AFHR_FLPR_YN": "N",
             "OFL_YN": "",
             "INQR_DVSN": "02",
@@ -1055,10 +1772,10 @@ class KISAPIClient:
         balance_data = await self.get_account_balance()
         positions = balance_data.get("output1", [])
 
-        # 보유 수량이 있는 종목만 필터링
+        # 보유 수량이 있는 종목만 필터링 — 대다수인 "0" 행은 int() 파싱 없이 탈락
         active_positions = [
             pos for pos in positions
-            if int(pos.get("hldg_qty", "0")) > 0
+            if (q := pos.get("hldg_qty")) and q != "0" and int(q) > 0
         ]
 
         return active_positions
@@ -1099,75 +1816,155 @@ class KISAPIClient:
         # 새 모드의 토큰 로드 시도
         self.access_token = None
         self.token_expires_at = None
+        self._token_deadline_mono = None
+
+        # 모드에 따라 주문 TR_ID가 달라지므로 미리 조립한 상수 재구성
+        self._refresh_order_constants()
+
+        # 집계 지표 캐시는 모드 의존 내용(모의 모드의 "(Mock)" 폴백 행 등)을
+        # 담으므로 전환 즉시 무효화 — 직렬화 캐시도 쌍으로 버린다
+        self._indicators_cache = None
+        self._indicators_bytes = None
 
         logger.info(f"Token reset for mode change. Will attempt to load {new_mode} token on next request.")
 
+    # 집계 지표 캐시 TTL (초) — 지수/순위 개별 캐시와 같은 주기
+    _INDICATORS_TTL = 5.0
+
+    # 지수 분 버킷 캐시 상한 (초과 시 FIFO 축출)
+    _INDEX_MINUTE_CACHE_MAX = 256
+
     async def get_market_indicators(self) -> Dict[str, Any]:
-        """시장 지표 조회 (코스피, 코스닥, 환율 등)"""
-        try:
-            await self.ensure_valid_token()
+        """시장 지표 조회 (TTL 캐시 + 동시 미스 병합)
 
-            # 시장 지표 저장소
-            indicators = {}
+        대시보드가 여러 클라이언트에서 주기적으로 폴링하므로, 집계 결과를
+        짧게 캐싱하고 캐시 미스는 락으로 병합해 상류 호출을 1회로 줄인다.
+        """
+        cached = self._indicators_cache
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        async with self._indicators_lock:
+            # 락 대기 중 다른 코루틴이 이미 채웠으면 그대로 사용
+            cached = self._indicators_cache
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+            indicators = await self._build_market_indicators()
+
+            # 에러 응답은 캐싱하지 않음 (다음 폴링에서 즉시 재시도)
+            if "error" not in indicators:
+                self._indicators_cache = (
+                    time.monotonic() + self._INDICATORS_TTL, indicators
+                )
+                # 캐시 갱신 시 직렬화도 1회 — 바이트 응답 경로에서 재사용
+                self._indicators_bytes = orjson.dumps(indicators)
+            return indicators
+
+    async def get_market_indicators_bytes(self) -> bytes:
+        """직렬화된 시장 지표 JSON bytes 반환
+
+        캐시 적중 시 dict→JSON 변환 없이 갱신 시점에 만들어 둔 bytes를
+        그대로 반환한다. 에러 응답처럼 캐시되지 않은 결과만 즉석 직렬화.
+        """
+        cached = self._indicators_cache
+        if cached and time.monotonic() < cached[0] and self._indicators_bytes is not None:
+            return self._indicators_bytes
 
-            # 1. 코스피 지수 조회
+        indicators = await self.get_market_indicators()
+        cached = self._indicators_cache
+        if cached and cached[1] is indicators and self._indicators_bytes is not None:
+            return self._indicators_bytes
+        return orjson.dumps(indicators)
+
+    def start_indicator_stream(self, interval: float = 5.0):
+        """지표 스냅샷 주기 갱신 + WebSocket 푸시 태스크 시작
+
+        폴링 클라이언트가 몇 명이든 상류 KIS 호출은 이 루프의 주기 1회로
+        고정되고, HTTP 폴링은 루프가 데워 둔 TTL 캐시를 그대로 읽는다.
+        """
+        if self._indicator_push_task and not self._indicator_push_task.done():
+            return
+        self._indicator_push_task = asyncio.create_task(
+            self._indicator_refresh_loop(interval)
+        )
+
+    async def stop_indicator_stream(self):
+        """지표 푸시 태스크 중지"""
+        if self._indicator_push_task and not self._indicator_push_task.done():
+            self._indicator_push_task.cancel()
+        self._indicator_push_task = None
+
+    async def _indicator_refresh_loop(self, interval: float):
+        """접속 클라이언트가 있을 때만 지표를 갱신해 브로드캐스트"""
+        # 순환 import 방지를 위한 지연 로드 (websocket 모듈은 서비스 계층을 모름)
+        from ..api.websocket import manager, send_market_indicators
+
+        while True:
             try:
-                kospi_data = await self.get_market_index("0001")  # 코스피 코드
-                if kospi_data:
-                    indicators["kospi"] = {
-                        "current": float(kospi_data.get("bstp_nmix_prpr", 0)),
-                        "change": float(kospi_data.get("bstp_nmix_prdy_vrss", 0)),
-                        "change_rate": float(kospi_data.get("prdy_vrss_sign", 0)),
-                        "volume": int(kospi_data.get("acml_vol", 0)),
-                        "status": "open" if self._is_market_open() else "closed"
-                    }
+                if manager.active_connections:
+                    indicators = await self.get_market_indicators()
+                    await send_market_indicators(indicators)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Failed to get KOSPI data: {e}")
-                indicators["kospi"] = {"error": f"KOSPI data unavailable: {str(e)}", "status": "error"}
+                logger.warning(f"Indicator refresh loop error: {e}")
 
-            # 2. 코스닥 지수 조회
-            try:
-                kosdaq_data = await self.get_market_index("1001")  # 코스닥 코드
-                if kosdaq_data:
-                    indicators["kosdaq"] = {
-                        "current": float(kosdaq_data.get("bstp_nmix_prpr", 0)),
-                        "change": float(kosdaq_data.get("bstp_nmix_prdy_vrss", 0)),
-                        "change_rate": float(kosdaq_data.get("prdy_vrss_sign", 0)),
-                        "volume": int(kosdaq_data.get("acml_vol", 0)),
-                        "status": "open" if self._is_market_open() else "closed"
+            await asyncio.sleep(interval)
+
+    async def _build_market_indicators(self) -> Dict[str, Any]:
+        """시장 지표 조회 (코스피, 코스닥, 환율 등)"""
+        try:
+            # 시장 지표 저장소 (토큰 확보는 _make_request 계층에서 처리)
+            indicators = {}
+
+            is_open, session, next_open = self._market_state()
+
+            # 코스피/코스닥/거래량 상위는 서로 독립이므로 동시 조회
+            kospi_result, kosdaq_result, volume_result = await asyncio.gather(
+                self.get_market_index("0001"),   # 코스피 코드
+                self.get_market_index("1001"),   # 코스닥 코드
+                self.get_stock_volume_ranking(),
+                return_exceptions=True
+            )
+
+            # 1-2. 코스피/코스닥 지수 — 동일 후처리를 한 루프로 (상태 문자열은 1회 계산)
+            index_status = "open" if is_open else "closed"
+            for key, label, result in (
+                ("kospi", "KOSPI", kospi_result),
+                ("kosdaq", "KOSDAQ", kosdaq_result)
+            ):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to get {label} data: {result}")
+                    indicators[key] = {"error": f"{label} data unavailable: {result}", "status": "error"}
+                elif result:
+                    indicators[key] = {
+                        "current": _to_float(result, "bstp_nmix_prpr"),
+                        "change": _to_float(result, "bstp_nmix_prdy_vrss"),
+                        "change_rate": _to_float(result, "prdy_vrss_sign"),
+                        "volume": _to_int(result, "acml_vol"),
+                        "status": index_status
                     }
-            except Exception as e:
-                logger.error(f"Failed to get KOSDAQ data: {e}")
-                indicators["kosdaq"] = {"error": f"KOSDAQ data unavailable: {str(e)}", "status": "error"}
 
             # 3. 원달러 환율 조회
             # 참고: KIS API는 환율 정보를 제공하지 않아서 외부 API가 필요함
             # 현재는 고정값 사용 (향후 Yahoo Finance API 또는 한국은행 API 연동 가능)
-            indicators["usd_krw"] = {
-                "current": 1340.5,
-                "change": 5.2,
-                "change_rate": 0.39,
-                "status": "static_data",
-                "note": "환율 데이터는 KIS API 미제공으로 정적 값 사용"
-            }
+            indicators["usd_krw"] = _DEFAULT_USD_KRW
 
             # 4. 거래량 상위 종목
-            try:
-                volume_leaders = await self.get_stock_volume_ranking()
-                if volume_leaders:
-                    indicators["volume_leaders"] = volume_leaders[:5]
-                else:
-                    indicators["volume_leaders"] = []
-            except Exception as e:
-                logger.warning(f"Failed to get volume leaders: {e}")
+            if isinstance(volume_result, BaseException):
+                logger.warning(f"Failed to get volume leaders: {volume_result}")
                 indicators["volume_leaders"] = []
+            else:
+                # [:5]는 빈 리스트에도 안전하므로 분기 없이 한 표현식으로 처리
+                indicators["volume_leaders"] = (volume_result or [])[:5]
 
             # 5. 시장 상태
             indicators["market_status"] = {
-                "is_open": self._is_market_open(),
-                "session": self._get_market_session(),
-                "next_open": self._get_next_market_open(),
-                "last_updated": datetime.now().isoformat()
+                "is_open": is_open,
+                "session": session,
+                "next_open": next_open,
+                "last_updated": _now_iso()
             }
 
             logger.info("Market indicators retrieved successfully")
@@ -1175,54 +1972,32 @@ class KISAPIClient:
 
         except Exception as e:
             logger.error(f"Critical error getting market indicators: {e}")
+            is_open, session, next_open = self._market_state()
             # Live Trading에서는 실제 데이터만 허용 - 에러 상태 반환
-            return {
-                "kospi": {"error": "API 연결 실패", "status": "error"},
-                "kosdaq": {"error": "API 연결 실패", "status": "error"},
-                "usd_krw": {
-                    "current": 1340.5,
-                    "change": 5.2,
-                    "change_rate": 0.39,
-                    "status": "static_data",
-                    "note": "환율 데이터는 KIS API 미제공으로 정적 값 사용"
-                },
-                "volume_leaders": [],
-                "market_status": {
-                    "is_open": self._is_market_open(),
-                    "session": self._get_market_session(),
-                    "next_open": self._get_next_market_open(),
-                    "last_updated": datetime.now().isoformat()
-                },
-                "error": f"Market indicators unavailable: {str(e)}",
-                "message": "Live Trading 모드에서는 실제 KIS API 데이터가 필요합니다"
+            # (정적 부분은 모듈 템플릿 공유, 동적 필드만 패치)
+            fallback = dict(_FALLBACK_INDICATORS_TEMPLATE)
+            fallback["market_status"] = {
+                "is_open": is_open,
+                "session": session,
+                "next_open": next_open,
+                "last_updated": _now_iso()
             }
+            fallback["error"] = f"Market indicators unavailable: {str(e)}"
+            return fallback
 
     async def get_market_index(self, index_code: str) -> Dict[str, Any]:
-        """지수 정보 조회 - 실제 KIS API 사용"""
-        try:
-            await self.ensure_valid_token()
+        """지수 정보 조회 - 실제 KIS API 사용
 
-            # 시뮬레이션 모드에서는 mock 데이터 반환
-            simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
-            if self.is_mock_trading and simulation_mode:
+        네트워크 호출은 _make_request를 거치므로 토큰 확보/요청 병합은
+        그 계층에서 처리된다. 여기서 선제로 토큰을 확보하면 시뮬레이션
+        분기에서도 불필요한 토큰 트래픽이 생긴다.
+        """
+        try:
+            # 시뮬레이션 모드에서는 mock 데이터 반환 (지수 코드별 dict 디스패치)
+            if self.is_mock_trading and self._simulation_mode:
                 logger.info(f"🎮 SIMULATION: Market index for {index_code}")
-                if index_code == "0001":  # KOSPI
-                    return {
-                        "current": 2580.45,
-                        "change": 30.2,
-                        "change_rate": 1.2,
-                        "volume": 450000000,
-                        "status": "open"
-                    }
-                elif index_code == "1001":  # KOSDAQ
-                    return {
-                        "current": 768.92,
-                        "change": -6.1,
-                        "change_rate": -0.8,
-                        "volume": 680000000,
-                        "status": "open"
-                    }
-                return {}
+                mock_data = _SIM_INDEX_DATA.get(index_code)
+                return dict(mock_data) if mock_data else {}
 
             # Live Trading에서는 KIS API 한계로 인해 시장지수 API 비활성화
             # 사용자 요구사항: 실제 데이터가 없으면 "데이터 없음"으로 처리
@@ -1237,142 +2012,58 @@ class KISAPIClient:
                 return {}
 
             # Mock Trading에서만 fallback 데이터 사용
-            if index_code == "0001":  # KOSPI
-                return {
-                    "current": 2580.45,
-                    "change": 30.2,
-                    "change_rate": 1.2,
-                    "volume": 450000000,
-                    "status": "open"
-                }
-            elif index_code == "1001":  # KOSDAQ
-                return {
-                    "current": 768.92,
-                    "change": -6.1,
-                    "change_rate": -0.8,
-                    "volume": 680000000,
-                    "status": "open"
-                }
-            return {}
+            mock_data = _SIM_INDEX_DATA.get(index_code)
+            return dict(mock_data) if mock_data else {}
 
-        # 이전 코드 주석 처리
-        try:
-            await self.ensure_valid_token()
+    def _market_state(self) -> tuple:
+        """(개장 여부, 세션, 다음 개장) — 같은 초 내 반복 호출은 캐시로 응답
 
-            # 모의투자 시뮬레이션 모드 - API 연결 없이 테스트 (개발 환경)
-            simulation_mode = getattr(self.settings, 'KIS_SIMULATION_MODE', True)
-            if self.is_mock_trading and simulation_mode:
-                logger.info(f"🎮 SIMULATION: Market index for {index_code}")
-                import random
-
-                if index_code == "0001":  # 코스피
-                    base_price = 2500.0
-                    change = random.uniform(-50, 50)
-                    return {
-                        "bstp_nmix_prpr": str(base_price + change),
-                        "bstp_nmix_prdy_vrss": str(change),
-                        "prdy_vrss_sign": str(change / base_price * 100),
-                        "acml_vol": str(random.randint(400000000, 500000000))
-                    }
-                elif index_code == "1001":  # 코스닥
-                    base_price = 750.0
-                    change = random.uniform(-20, 20)
-                    return {
-                        "bstp_nmix_prpr": str(base_price + change),
-                        "bstp_nmix_prdy_vrss": str(change),
-                        "prdy_vrss_sign": str(change / base_price * 100),
-                        "acml_vol": str(random.randint(600000000, 700000000))
-                    }
-                else:
-                    return {}
-
-            # 실제 KIS API 호출 - 지수시세 조회 전용 API 시도
-            endpoint = "/uapi/domestic-stock/v1/quotations/inquire-index-price"
-            headers = {"tr_id": "FHKST01010300"}  # 시세 조회 관련 TR_ID 시도
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "U",  # U: 지수
-                "FID_INPUT_ISCD": index_code
-            }
-
-            response = await self._make_request("GET", endpoint, headers=headers, params=params)
-            logger.info(f"Market index {index_code} full response: {response}")
-
-            output = response.get("output", {})
-
-            if output:
-                logger.info(f"Successfully retrieved market index {index_code}")
-                return output
-            else:
-                logger.warning(f"Empty response for market index {index_code}. Full response: {response}")
-                return {}
-
-        except Exception as e:
-            logger.error(f"Error getting market index {index_code}: {e}")
-            # Live Trading에서는 실제 데이터가 없으면 빈 데이터 반환 (mock data 사용 금지)
-            if not self.is_mock_trading:
-                logger.warning(f"💰 Real trading mode: No valid market index data for {index_code}")
-                return {}
-
-            # Mock Trading에서만 fallback 데이터 사용
-            if index_code == "0001":  # KOSPI
-                return {
-                    "bstp_nmix_prpr": "2580.45",
-                    "bstp_nmix_prdy_vrss": "+30.2",
-                    "prdy_vrss_sign": "1.2",
-                    "acml_vol": "450000000"
-                }
-            elif index_code == "1001":  # KOSDAQ
-                return {
-                    "bstp_nmix_prpr": "768.92",
-                    "bstp_nmix_prdy_vrss": "-6.1",
-                    "prdy_vrss_sign": "-0.8",
-                    "acml_vol": "680000000"
-                }
-            return {}
+        지표 집계 한 번에 개장 여부/세션 계산이 여러 번 불리므로
+        datetime.now() 기반 재계산을 초당 1회로 줄인다.
+        """
+        now_second = int(time.time())
+        cached = self._market_state_cache
+        if cached and cached[0] == now_second:
+            return cached[1]
 
-    def _is_market_open(self) -> bool:
-        """시장 개장 여부 확인"""
+        # 한 번의 상태 계산에 datetime.now()는 한 번만 — 각 헬퍼에 전달
         now = datetime.now()
+        state = (
+            self._is_market_open(now),
+            self._get_market_session(now),
+            self._get_next_market_open(now)
+        )
+        self._market_state_cache = (now_second, state)
+        return state
+
+    def _is_market_open(self, now: datetime) -> bool:
+        """시장 개장 여부 확인 (호출은 _market_state() 캐시를 경유)"""
         # 주말 확인
         if now.weekday() >= 5:  # 토요일(5), 일요일(6)
             return False
 
-        # 시간 확인 (09:00 - 15:30)
-        current_time = now.strftime("%H%M")
-        return "0900" <= current_time <= "1530"
-
-    def _get_market_session(self) -> str:
-        """현재 시장 세션 구분"""
-        now = datetime.now()
-        current_time = now.strftime("%H%M")
+        # 시간 확인 (09:00 - 15:30) — HHMM 정수 비교 (strftime 문자열 생성 회피)
+        return _MARKET_OPEN_HHMM <= _hm(now) <= _MARKET_CLOSE_HHMM
 
+    def _get_market_session(self, now: datetime) -> str:
+        """현재 시장 세션 구분 (호출은 _market_state() 캐시를 경유)"""
         if now.weekday() >= 5:
             return "weekend"
-        elif current_time < "0900":
-            return "pre_market"
-        elif "0900" <= current_time <= "1530":
-            return "regular"
-        elif "1530" < current_time <= "1800":
-            return "after_hours"
-        else:
-            return "closed"
-
-    def _get_next_market_open(self) -> str:
-        """다음 시장 개장 시간"""
-        now = datetime.now()
+        # 정렬된 경계 테이블에 대한 bisect 한 번으로 4분기 비교를 대체
+        return _SESSION_NAMES[bisect_right(_SESSION_BOUNDARIES, _hm(now))]
 
+    def _get_next_market_open(self, now: datetime) -> str:
+        """다음 시장 개장 시각 (ISO 8601, 호출은 _market_state() 캐시를 경유)"""
         # 오늘이 평일이고 오전 9시 이전이면 오늘 09:00
-        if now.weekday() < 5 and now.strftime("%H%M") < "0900":
-            return "09:00"
-
-        # 그렇지 않으면 다음 평일 09:00
-        days_ahead = 1
-        if now.weekday() == 4:  # 금요일
-            days_ahead = 3  # 다음 월요일
-        elif now.weekday() == 5:  # 토요일
-            days_ahead = 2  # 다음 월요일
+        if now.weekday() < 5 and _hm(now) < _MARKET_OPEN_HHMM:
+            next_open = now
+        else:
+            # 그렇지 않으면 다음 평일 09:00 (요일별 일수 테이블 참조)
+            next_open = now + timedelta(days=_NEXT_OPEN_DAYS[now.weekday()])
 
-        return "09:00"
+        return next_open.replace(
+            hour=9, minute=0, second=0, microsecond=0
+        ).isoformat()
 
     def get_trading_mode(self) -> Dict[str, Any]:
         """현재 거래 모드 조회"""
@@ -1390,10 +2081,12 @@ class KISAPIClient:
             await self.ensure_valid_token()
 
             # 연결 상태 확인 (토큰이 있고 유효하면 연결됨)
+            # ensure_valid_token과 같은 모노토닉 데드라인 비교 (5분 여유 포함,
+            # datetime/timedelta 객체를 호출마다 할당하지 않음)
             is_connected = (
                 self.access_token is not None and
-                self.token_expires_at is not None and
-                datetime.now() < self.token_expires_at - timedelta(minutes=5)
+                self._token_deadline_mono is not None and
+                self._loop.time() < self._token_deadline_mono
             )
 
             return {
@@ -1448,12 +2141,19 @@ class KISAPIClient:
         Args:
             index_code: 지수 코드 (0001: KOSPI, 1001: KOSDAQ, 2001: KOSPI200)
         """
+        # 2차 캐시: 같은 분 버킷의 동일 지수 조회는 파싱된 결과를 그대로 재사용
+        minute_bucket = int(time.time()) // 60
+        cache_key = (index_code, minute_bucket)
+        cached = self._index_minute_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         await self.ensure_valid_token()
 
         endpoint = "/uapi/domestic-stock/v1/quotations/inquire-index-price"
 
         headers = {
-            "tr_id": "FHPUP02100000"
+            "tr_id": _TR_INDEX_PRICE
         }
 
         params = {
@@ -1463,67 +2163,72 @@ class KISAPIClient:
 
         try:
             # 지수 데이터는 모의투자 모드에서도 실거래 API 사용
-            # 시장 정보는 공개 데이터이므로 안전
-            original_base_url = self.base_url
-            original_is_mock = self.is_mock_trading
-
-            if self.is_mock_trading:
-                logger.info(f"Using real API for index data: {index_code}")
-                self.base_url = self.settings.KIS_BASE_URL
-                self.is_mock_trading = False
-
-            response = await self._make_request("GET", endpoint, headers=headers, params=params)
-
-            # 원래 설정으로 복원
-            self.base_url = original_base_url
-            self.is_mock_trading = original_is_mock
+            # 시장 정보는 공개 데이터이므로 안전. 호출 단위 base_url 인자로
+            # 전달한다 — self.base_url/is_mock_trading을 임시 변이하는 방식은
+            # gather로 KOSPI/KOSDAQ을 동시 조회할 때 서로의 복원과 경합한다.
+            # 공개 지수 데이터는 짧게 캐싱 — 동시/연속 조회 시 왕복을 1회로 병합
+            response = await self._make_request(
+                "GET", endpoint, headers=headers, params=params, cache_ttl=5.0,
+                base_url=self.settings.KIS_BASE_URL
+            )
 
             output = response.get("output", {})
 
             if output:
-                # 지수 정보를 구조화된 형태로 반환
-                return {
+                # 지수 정보를 구조화된 형태로 반환 — 필드 매핑 테이블을
+                # 한 루프로 순회 (필드당 .get() 1회, 결측/공백은 0 처리)
+                result = {
                     "index_code": index_code,
-                    "index_name": "KOSPI" if index_code == "0001" else "KOSDAQ" if index_code == "1001" else "KOSPI200",
-                    "current_price": float(output.get("bstp_nmix_prpr", "0")),
-                    "change": float(output.get("bstp_nmix_prdy_vrss", "0")),
-                    "change_rate": float(output.get("bstp_nmix_prdy_ctrt", "0")),
-                    "change_sign": output.get("prdy_vrss_sign", ""),
-                    "volume": int(output.get("acml_vol", "0")),
-                    "trade_amount": int(output.get("acml_tr_pbmn", "0")),
-                    "open_price": float(output.get("bstp_nmix_oprc", "0")),
-                    "high_price": float(output.get("bstp_nmix_hgpr", "0")),
-                    "low_price": float(output.get("bstp_nmix_lwpr", "0")),
-                    "up_count": int(output.get("ascn_issu_cnt", "0")),
-                    "down_count": int(output.get("down_issu_cnt", "0")),
-                    "unchanged_count": int(output.get("stnr_issu_cnt", "0")),
-                    "year_high": float(output.get("dryy_bstp_nmix_hgpr", "0")),
-                    "year_high_date": output.get("dryy_bstp_nmix_hgpr_date", ""),
-                    "year_low": float(output.get("dryy_bstp_nmix_lwpr", "0")),
-                    "year_low_date": output.get("dryy_bstp_nmix_lwpr_date", "")
+                    "index_name": _INDEX_NAMES.get(index_code, index_code)
                 }
+                output_get = output.get
+                for dst, src, cast in _INDEX_PRICE_FIELDS:
+                    v = output_get(src)
+                    if cast is None:
+                        result[dst] = v or ""
+                    else:
+                        result[dst] = cast(v) if v else cast(0)
+                if len(self._index_minute_cache) >= self._INDEX_MINUTE_CACHE_MAX:
+                    # dict 삽입 순서 = FIFO: 가장 오래된 버킷부터 축출
+                    self._index_minute_cache.pop(next(iter(self._index_minute_cache)))
+                self._index_minute_cache[cache_key] = result
+                return result
             else:
                 logger.warning(f"No data received for index {index_code}")
                 return None
 
         except Exception as e:
-            # 원래 설정으로 복원 (예외 상황에서도)
-            self.base_url = original_base_url
-            self.is_mock_trading = original_is_mock
             logger.error(f"Failed to fetch index price for {index_code}: {e}")
             return None
 
 
 # 싱글톤 인스턴스 생성 함수
 _kis_client_instance: Optional[KISAPIClient] = None
+_kis_client_init_lock = asyncio.Lock()
 
 async def get_kis_client() -> KISAPIClient:
-    """KIS API 클라이언트 싱글톤 인스턴스 반환"""
+    """KIS API 클라이언트 싱글톤 인스턴스 반환
+
+    핫패스는 락 없이 None 체크 한 번으로 끝나고, 최초 초기화만 락으로
+    직렬화한다. start()가 await하는 동안 동시 호출이 들어와도 클라이언트
+    (세션/커넥션 풀)가 중복 생성되지 않는다.
+    """
     global _kis_client_instance
 
-    if _kis_client_instance is None:
-        _kis_client_instance = KISAPIClient()
-        await _kis_client_instance.start()
+    if _kis_client_instance is not None:
+        return _kis_client_instance
+
+    async with _kis_client_init_lock:
+        if _kis_client_instance is None:
+            client = KISAPIClient()
+            try:
+                await client.start()
+            except BaseException:
+                # start() 실패 시 공유 세션 참조를 반환하고 다음 호출에서
+                # 재시도 — 실패한 반쪽 클라이언트를 싱글톤으로 남기지 않는다
+                await client.close()
+                raise
+            _kis_client_instance = client
 
     return _kis_client_instance
 
@@ -1533,4 +2238,6 @@ async def close_kis_client():
 
     if _kis_client_instance:
         await _kis_client_instance.close()
-        _kis_client_instance = None
\ No newline at end of file
+        _kis_client_instance = None
+
+    await shutdown_shared_connector()
\ No newline at end of file
@@ -5,19 +5,21 @@ Task Scheduler Service
 
 import asyncio
 import logging
-from datetime import datetime, time, timedelta
+from datetime import datetime, time
 from typing import Dict, List, Optional, Callable, Any
 from enum import Enum
+from operator import itemgetter
 import schedule
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from app.core.filtering.filter_engine import filter_engine
+from app.core.filtering.stock_filter import get_filter_engine
 from app.core.monitoring.session_manager import session_manager
 from app.core.trading.position_manager import position_manager
 from app.core.trading.exit_strategy import exit_strategy
-from app.api.websocket import send_scheduler_update
-from app.utils.config import get_config
+from app.api.websocket import send_scheduler_update, manager as ws_manager
+from app.schemas.trading import FilterConditions
+from app.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +40,18 @@ class TaskType(str, Enum):
     MARKET_CLOSE_CLEANUP = "market_close_cleanup"
 
 class ScheduledTask:
-    """스케줄된 태스크"""
+    """스케줄된 태스크
+
+    매 발화/상태 조회마다 속성에 접근하므로 __slots__로 인스턴스
+    __dict__를 제거 — 속성 접근은 슬롯 오프셋 조회로, 태스크당
+    메모리도 줄어든다.
+    """
+    __slots__ = (
+        "task_id", "task_type", "name", "func", "trigger_time", "trigger_hm",
+        "enabled", "description", "trigger", "last_run", "next_run",
+        "run_count", "error_count", "last_error"
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -47,114 +60,112 @@ class ScheduledTask:
         func: Callable,
         trigger_time: time,
         enabled: bool = True,
-        description: str = ""
+        description: str = "",
+        trigger: Optional[CronTrigger] = None
     ):
         self.task_id = task_id
         self.task_type = task_type
         self.name = name
         self.func = func
         self.trigger_time = trigger_time
+        # "HH:MM" 표기는 생성 시 1회만 포맷 (상태 조회마다 strftime 방지)
+        self.trigger_hm = trigger_time.strftime("%H:%M")
         self.enabled = enabled
         self.description = description
+        # 트리거는 태스크 생성 시 1회만 구성 — 활성화/재시작마다 재구성하지 않음
+        self.trigger = trigger or CronTrigger(
+            hour=trigger_time.hour,
+            minute=trigger_time.minute,
+            timezone=_SCHEDULER_TIMEZONE
+        )
         self.last_run: Optional[datetime] = None
         self.next_run: Optional[datetime] = None
         self.run_count = 0
         self.error_count = 0
         self.last_error: Optional[str] = None
 
+
+# 스케줄러 타임존
+_SCHEDULER_TIMEZONE = "Asia/Seoul"
+
+
+def _cron(hour: int, minute: int) -> CronTrigger:
+    """기본 태스크 명세용 CronTrigger 생성 (모듈 로드 시 1회)"""
+    return CronTrigger(hour=hour, minute=minute, timezone=_SCHEDULER_TIMEZONE)
+
+
+# 기본 스케줄 태스크 명세: (task_id, 유형, 이름, 메서드명, 실행 시각, 설명, 트리거)
+# 트리거까지 모듈 로드 시 미리 구성해 스케줄러 (재)시작 비용을 줄인다
+_TASK_SPECS = (
+    ("daily_filtering_1530", TaskType.DAILY_FILTERING,
+     "Daily Stock Filtering", "_execute_daily_filtering", time(15, 30),
+     "Execute daily stock filtering at market close", _cron(15, 30)),
+    ("monitoring_start_1600", TaskType.MONITORING_START,
+     "Start After-hours Monitoring", "_start_monitoring", time(16, 0),
+     "Start after-hours price monitoring", _cron(16, 0)),
+    ("monitoring_check_1630", TaskType.MONITORING_CHECK,
+     "Monitoring Checkpoint 16:30", "_monitoring_checkpoint", time(16, 30),
+     "Check monitoring status at 16:30", _cron(16, 30)),
+    ("monitoring_check_1700", TaskType.MONITORING_CHECK,
+     "Monitoring Checkpoint 17:00", "_monitoring_checkpoint", time(17, 0),
+     "Check monitoring status at 17:00", _cron(17, 0)),
+    ("monitoring_check_1730", TaskType.MONITORING_CHECK,
+     "Monitoring Checkpoint 17:30", "_monitoring_checkpoint", time(17, 30),
+     "Check monitoring status at 17:30", _cron(17, 30)),
+    ("position_monitoring_0900", TaskType.POSITION_MONITORING,
+     "Start Position Monitoring", "_start_position_monitoring", time(9, 0),
+     "Start monitoring active positions", _cron(9, 0)),
+    ("exit_strategy_0900", TaskType.EXIT_STRATEGY,
+     "Start Exit Strategy", "_start_exit_strategy", time(9, 0),
+     "Start time-based exit strategy", _cron(9, 0)),
+    ("force_liquidation_1520", TaskType.FORCE_LIQUIDATION,
+     "Force Liquidation", "_force_liquidation", time(15, 20),
+     "Force liquidate all positions before market close", _cron(15, 20)),
+    ("market_close_cleanup_1535", TaskType.MARKET_CLOSE_CLEANUP,
+     "Market Close Cleanup", "_market_close_cleanup", time(15, 35),
+     "Clean up and prepare for next trading day", _cron(15, 35))
+)
+
 class TradingScheduler:
     """거래 전략 자동화 스케줄러"""
 
     def __init__(self):
-        self.config = get_config()
+        self.config = get_settings()
         self.scheduler = AsyncIOScheduler()
         self.status = SchedulerStatus.STOPPED
         self.tasks: Dict[str, ScheduledTask] = {}
 
         # 스케줄링 설정
-        self.timezone = "Asia/Seoul"
+        self.timezone = _SCHEDULER_TIMEZONE
 
         # 실행 상태 추적
         self.daily_tasks_completed = False
         self.monitoring_active = False
         self.position_monitoring_active = False
 
+        # 태스크 상세 페이로드 캐시 (None이면 다음 조회 시 재구성)
+        # UI 폴링이 잦은 읽기 경로라 상태 변경 시에만 무효화한다
+        self._task_details_cache: Optional[List[Dict[str, Any]]] = None
+
         self._initialize_scheduled_tasks()
 
     def _initialize_scheduled_tasks(self):
-        """기본 스케줄 태스크들 초기화"""
-
-        # Day 1: 15:30 - 일일 주식 필터링
-        self.add_task(
-            task_id="daily_filtering_1530",
-            task_type=TaskType.DAILY_FILTERING,
-            name="Daily Stock Filtering",
-            func=self._execute_daily_filtering,
-            trigger_time=time(15, 30),
-            description="Execute daily stock filtering at market close"
-        )
-
-        # Day 1: 16:00 - 애프터마켓 모니터링 시작
-        self.add_task(
-            task_id="monitoring_start_1600",
-            task_type=TaskType.MONITORING_START,
-            name="Start After-hours Monitoring",
-            func=self._start_monitoring,
-            trigger_time=time(16, 0),
-            description="Start after-hours price monitoring"
-        )
+        """기본 스케줄 태스크들 초기화 (모듈 명세 테이블 순회)
 
-        # Day 1: 16:30, 17:00, 17:30 - 모니터링 체크포인트
-        for hour, minute in [(16, 30), (17, 0), (17, 30)]:
+        Day 1: 15:30 필터링 → 16:00 모니터링 시작 → 16:30/17:00/17:30 체크포인트
+        Day 2: 09:00 포지션 모니터링/매도 전략 → 15:20 강제 청산 → 15:35 정리
+        """
+        for task_id, task_type, name, attr_name, trigger_time, description, trigger in _TASK_SPECS:
             self.add_task(
-                task_id=f"monitoring_check_{hour:02d}{minute:02d}",
-                task_type=TaskType.MONITORING_CHECK,
-                name=f"Monitoring Checkpoint {hour:02d}:{minute:02d}",
-                func=self._monitoring_checkpoint,
-                trigger_time=time(hour, minute),
-                description=f"Check monitoring status at {hour:02d}:{minute:02d}"
+                task_id=task_id,
+                task_type=task_type,
+                name=name,
+                func=getattr(self, attr_name),
+                trigger_time=trigger_time,
+                description=description,
+                trigger=trigger
             )
 
-        # Day 2: 09:00 - 포지션 모니터링 시작
-        self.add_task(
-            task_id="position_monitoring_0900",
-            task_type=TaskType.POSITION_MONITORING,
-            name="Start Position Monitoring",
-            func=self._start_position_monitoring,
-            trigger_time=time(9, 0),
-            description="Start monitoring active positions"
-        )
-
-        # Day 2: 09:00 - 시간 기반 매도 전략 시작
-        self.add_task(
-            task_id="exit_strategy_0900",
-            task_type=TaskType.EXIT_STRATEGY,
-            name="Start Exit Strategy",
-            func=self._start_exit_strategy,
-            trigger_time=time(9, 0),
-            description="Start time-based exit strategy"
-        )
-
-        # Day 2: 15:20 - 강제 청산
-        self.add_task(
-            task_id="force_liquidation_1520",
-            task_type=TaskType.FORCE_LIQUIDATION,
-            name="Force Liquidation",
-            func=self._force_liquidation,
-            trigger_time=time(15, 20),
-            description="Force liquidate all positions before market close"
-        )
-
-        # Day 2: 15:35 - 장 마감 정리
-        self.add_task(
-            task_id="market_close_cleanup_1535",
-            task_type=TaskType.MARKET_CLOSE_CLEANUP,
-            name="Market Close Cleanup",
-            func=self._market_close_cleanup,
-            trigger_time=time(15, 35),
-            description="Clean up and prepare for next trading day"
-        )
-
     def add_task(
         self,
         task_id: str,
@@ -163,7 +174,8 @@ class TradingScheduler:
         func: Callable,
         trigger_time: time,
         enabled: bool = True,
-        description: str = ""
+        description: str = "",
+        trigger: Optional[CronTrigger] = None
     ):
         """새 태스크 추가"""
         task = ScheduledTask(
@@ -173,15 +185,17 @@ class TradingScheduler:
             func=func,
             trigger_time=trigger_time,
             enabled=enabled,
-            description=description
+            description=description,
+            trigger=trigger
         )
 
         self.tasks[task_id] = task
+        self._task_details_cache = None
 
         if self.status == SchedulerStatus.RUNNING and enabled:
             self._schedule_task(task)
 
-        logger.info(f"📅 Task added: {name} at {trigger_time.strftime('%H:%M')}")
+        logger.info(f"📅 Task added: {name} at {task.trigger_hm}")
 
     def remove_task(self, task_id: str) -> bool:
         """태스크 제거"""
@@ -196,6 +210,7 @@ class TradingScheduler:
 
         # 태스크 딕셔너리에서 제거
         del self.tasks[task_id]
+        self._task_details_cache = None
 
         logger.info(f"📅 Task removed: {task_id}")
         return True
@@ -207,6 +222,7 @@ class TradingScheduler:
 
         task = self.tasks[task_id]
         task.enabled = True
+        self._task_details_cache = None
 
         if self.status == SchedulerStatus.RUNNING:
             self._schedule_task(task)
@@ -221,6 +237,7 @@ class TradingScheduler:
 
         task = self.tasks[task_id]
         task.enabled = False
+        self._task_details_cache = None
 
         try:
             self.scheduler.remove_job(task_id)
@@ -239,6 +256,11 @@ class TradingScheduler:
         self.status = SchedulerStatus.RUNNING
         logger.info("🕒 Starting trading scheduler")
 
+        # 첫 스텝에서 끝나는 코루틴(클라이언트 없음 등 조기 반환 경로)이
+        # call_soon 왕복 없이 인라인 완료되도록 eager 태스크 팩토리 설치
+        if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # 모든 활성화된 태스크를 스케줄러에 등록
         for task in self.tasks.values():
             if task.enabled:
@@ -247,6 +269,13 @@ class TradingScheduler:
         # 스케줄러 시작
         self.scheduler.start()
 
+        # 시작 시점에 pending 잡들의 next_run_time이 확정되므로 태스크에 반영
+        for job in self.scheduler.get_jobs():
+            task = self.tasks.get(job.id)
+            if task is not None:
+                task.next_run = getattr(job, "next_run_time", None)
+        self._task_details_cache = None
+
         # WebSocket으로 상태 업데이트
         await self._send_scheduler_update("started")
 
@@ -260,6 +289,7 @@ class TradingScheduler:
 
         # 스케줄러 종료
         self.scheduler.shutdown()
+        self._task_details_cache = None
 
         # WebSocket으로 상태 업데이트
         await self._send_scheduler_update("stopped")
@@ -289,42 +319,22 @@ class TradingScheduler:
         await self._send_scheduler_update("resumed")
 
     def _schedule_task(self, task: ScheduledTask):
-        """개별 태스크 스케줄링"""
-        trigger = CronTrigger(
-            hour=task.trigger_time.hour,
-            minute=task.trigger_time.minute,
-            timezone=self.timezone
-        )
-
-        self.scheduler.add_job(
+        """개별 태스크 스케줄링 (태스크에 미리 구성된 트리거 재사용)"""
+        job = self.scheduler.add_job(
             func=self._execute_task_wrapper,
-            trigger=trigger,
+            trigger=task.trigger,
             args=[task],
             id=task.task_id,
             name=task.name,
             replace_existing=True
         )
 
-        # 다음 실행 시간 계산
-        task.next_run = self._calculate_next_run(task.trigger_time)
+        # CronTrigger가 이미 계산한 다음 실행 시간을 그대로 사용
+        # (스케줄러 시작 전의 pending 잡은 아직 미계산 — start 시 반영)
+        task.next_run = getattr(job, "next_run_time", None)
 
         logger.debug(f"📅 Scheduled task: {task.name} -> {task.next_run}")
 
-    def _calculate_next_run(self, trigger_time: time) -> datetime:
-        """다음 실행 시간 계산"""
-        now = datetime.now()
-        today = now.date()
-
-        # 오늘의 실행 시간
-        today_run = datetime.combine(today, trigger_time)
-
-        if today_run > now:
-            return today_run
-        else:
-            # 내일의 실행 시간
-            tomorrow = today + timedelta(days=1)
-            return datetime.combine(tomorrow, trigger_time)
-
     async def _execute_task_wrapper(self, task: ScheduledTask):
         """태스크 실행 래퍼 (에러 처리 포함)"""
         logger.info(f"🔄 Executing scheduled task: {task.name}")
@@ -352,23 +362,22 @@ class TradingScheduler:
             await self._send_task_update(task, "failed", str(e))
 
         finally:
-            # 다음 실행 시간 업데이트
-            task.next_run = self._calculate_next_run(task.trigger_time)
+            # 다음 실행 시간 업데이트 — APScheduler가 재계산한 값을 재사용
+            job = self.scheduler.get_job(task.task_id)
+            task.next_run = getattr(job, "next_run_time", None) if job else None
+            self._task_details_cache = None
 
     # 스케줄된 태스크 함수들
     async def _execute_daily_filtering(self):
         """일일 주식 필터링 실행"""
         logger.info("📊 Starting daily stock filtering")
 
-        # 기본 필터링 조건으로 실행
-        result = await filter_engine.filter_stocks()
+        # 기본 필터링 조건으로 실행 — 실패(예외)는 태스크 래퍼가 집계한다
+        filter_engine = get_filter_engine()
+        filtered_stocks = await filter_engine.filter_stocks(FilterConditions())
 
-        if result.get("status") == "success":
-            filtered_count = len(result.get("filtered_stocks", []))
-            logger.info(f"📊 Daily filtering completed: {filtered_count} stocks filtered")
-            self.daily_tasks_completed = True
-        else:
-            logger.error(f"📊 Daily filtering failed: {result.get('message', 'Unknown error')}")
+        logger.info(f"📊 Daily filtering completed: {len(filtered_stocks)} stocks filtered")
+        self.daily_tasks_completed = True
 
     async def _start_monitoring(self):
         """애프터마켓 모니터링 시작"""
@@ -455,15 +464,18 @@ class TradingScheduler:
 
     async def get_scheduler_status(self) -> Dict[str, Any]:
         """스케줄러 상태 조회"""
-        running_jobs = []
-
         if self.status == SchedulerStatus.RUNNING:
-            for job in self.scheduler.get_jobs():
-                running_jobs.append({
+            # 잡 목록은 틱당 한 번의 get_jobs() 순회로 구성
+            running_jobs = [
+                {
                     "id": job.id,
                     "name": job.name,
                     "next_run": job.next_run_time.isoformat() if job.next_run_time else None
-                })
+                }
+                for job in self.scheduler.get_jobs()
+            ]
+        else:
+            running_jobs = []
 
         return {
             "status": self.status.value,
@@ -478,32 +490,47 @@ class TradingScheduler:
         }
 
     async def get_task_details(self) -> List[Dict[str, Any]]:
-        """태스크 상세 정보 조회"""
+        """태스크 상세 정보 조회 (상태 변경 시까지 캐시된 페이로드 반환)"""
+        # UI 폴링의 대다수는 상태 변화 없이 반복되므로 O(1)로 응답
+        if self._task_details_cache is not None:
+            return self._task_details_cache
+
         tasks = []
 
+        # 잡별 다음 실행 시간을 한 번에 조회 (태스크마다 get_job 호출 방지)
+        next_runs = {
+            job.id: getattr(job, "next_run_time", None)
+            for job in self.scheduler.get_jobs()
+        }
+
         for task in self.tasks.values():
+            next_run = next_runs.get(task.task_id, task.next_run)
             task_info = {
                 "task_id": task.task_id,
                 "task_type": task.task_type.value,
                 "name": task.name,
                 "description": task.description,
-                "trigger_time": task.trigger_time.strftime("%H:%M"),
+                "trigger_time": task.trigger_hm,
                 "enabled": task.enabled,
                 "run_count": task.run_count,
                 "error_count": task.error_count,
                 "last_run": task.last_run.isoformat() if task.last_run else None,
-                "next_run": task.next_run.isoformat() if task.next_run else None,
+                "next_run": next_run.isoformat() if next_run else None,
                 "last_error": task.last_error
             }
             tasks.append(task_info)
 
         # 시간순으로 정렬
-        tasks.sort(key=lambda x: x["trigger_time"])
+        tasks.sort(key=itemgetter("trigger_time"))
 
+        self._task_details_cache = tasks
         return tasks
 
     async def _send_scheduler_update(self, event: str):
         """WebSocket으로 스케줄러 업데이트 전송"""
+        # 접속 클라이언트가 없으면 상태 조립/직렬화 자체를 생략
+        if not ws_manager.active_connections:
+            return
         try:
             status = await self.get_scheduler_status()
             await send_scheduler_update({
@@ -516,6 +543,9 @@ class TradingScheduler:
 
     async def _send_task_update(self, task: ScheduledTask, status: str, error: str = None):
         """WebSocket으로 태스크 업데이트 전송"""
+        # 접속 클라이언트가 없으면 페이로드 조립 자체를 생략
+        if not ws_manager.active_connections:
+            return
         try:
             await send_scheduler_update({
                 "event": "task_update",
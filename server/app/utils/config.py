@@ -2,7 +2,6 @@
 Application configuration management
 """
 
-from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -62,7 +61,11 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-@lru_cache()
+# 모듈 로드 시 1회 생성 — .env 파싱/필드 검증을 반복하지 않고,
+# 핫패스의 lru_cache 래퍼(락 + 캐시 딕셔너리 조회)도 제거
+settings = Settings()
+
+
 def get_settings() -> Settings:
-    """설정 인스턴스 반환 (캐시됨)"""
-    return Settings()
\ No newline at end of file
+    """설정 인스턴스 반환 (모듈 단위 단일 인스턴스)"""
+    return settings
\ No newline at end of file
@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
 from enum import Enum
+from operator import itemgetter
 
 from app.utils.data_persistence import data_persistence
 
@@ -363,7 +364,7 @@ class ConfigManager:
                         "is_default": True
                     })
 
-        return sorted(presets, key=lambda x: x["name"])
+        return sorted(presets, key=itemgetter("name"))
 
     async def apply_preset(self, category: ConfigCategory, preset_name: str) -> bool:
         """프리셋을 현재 설정으로 적용"""
@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, date
+from operator import itemgetter
 import shutil
 import asyncio
 from dataclasses import is_dataclass, asdict
@@ -305,7 +306,7 @@ class DataPersistence:
                     })
 
             # 최신 순 정렬
-            backups.sort(key=lambda x: x["created"], reverse=True)
+            backups.sort(key=itemgetter("created"), reverse=True)
             return backups
 
         except Exception as e:
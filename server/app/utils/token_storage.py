@@ -21,6 +21,14 @@ class TokenStorage:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.token_file = self.storage_dir / "kis_token.json"
 
+        # 디코딩된 토큰의 프로세스 내 캐시: (파일 mtime, 데이터)
+        # 파일이 바뀌지 않는 한 load_token()은 디스크를 건드리지 않는다
+        self._cache: Optional[tuple] = None
+
+    def invalidate(self):
+        """캐시 무효화 (토큰 파일 변경 시 호출)"""
+        self._cache = None
+
     def save_token(self, token_data: Dict[str, Any]):
         """토큰 데이터 저장"""
         try:
@@ -35,6 +43,7 @@ class TokenStorage:
             with open(self.token_file, "w", encoding="utf-8") as f:
                 json.dump(data_to_save, f, indent=2, ensure_ascii=False)
 
+            self.invalidate()
             logger.info(f"Token saved to {self.token_file}")
 
         except Exception as e:
@@ -47,6 +56,11 @@ class TokenStorage:
                 logger.info("No stored token found")
                 return None
 
+            # mtime이 같으면 디코딩된 캐시 재사용 (stat 한 번으로 끝)
+            mtime = os.path.getmtime(self.token_file)
+            if self._cache is not None and self._cache[0] == mtime:
+                return self._cache[1]
+
             with open(self.token_file, "r", encoding="utf-8") as f:
                 token_data = json.load(f)
 
@@ -54,6 +68,7 @@ class TokenStorage:
             if "token_expires_at" in token_data:
                 token_data["token_expires_at"] = datetime.fromisoformat(token_data["token_expires_at"])
 
+            self._cache = (mtime, token_data)
             logger.info("Token loaded from storage")
             return token_data
 
@@ -85,6 +100,7 @@ class TokenStorage:
         try:
             if self.token_file.exists():
                 os.remove(self.token_file)
+                self.invalidate()
                 logger.info("Stored token cleared")
         except Exception as e:
             logger.error(f"Failed to clear token: {str(e)}")
@@ -4,10 +4,20 @@ import uvicorn
 import structlog
 import asyncio
 
+# uvloop이 설치되어 있으면 프로세스 전역 이벤트 루프 정책으로 사용
+# (libuv 기반 C 구현 — call_soon/call_at 디스패치와 셀렉터 오버헤드 감소,
+#  스케줄러 발화/WebSocket 브로드캐스트의 꼬리 지연 개선)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:  # uvloop 미지원 플랫폼에서는 기본 루프 사용
+    uvloop = None
+
 from app.utils.config import get_settings
 from app.api.endpoints import health, auth, stocks, portfolio, trading_mode, orders, monitoring, trading, market, market_indicators
 from app.api.websocket import ws_router
 from app.services.data_simulator import data_simulator
+from app.services.kis_api import get_kis_client, close_kis_client
 from app.core.trading.trading_controller import trading_controller
 
 # 설정 로드
@@ -83,6 +93,16 @@ async def startup_event():
     await data_simulator.start_simulation()
     logger.info("Data simulator started")
 
+    # 시장 지표 주기 갱신/푸시 시작 (접속 클라이언트가 있을 때만 상류 호출)
+    # 초기화 실패(토큰 발급 불가, 자격증명 미설정 등)가 서버 기동 자체를
+    # 막지 않도록 한다 — 클라이언트는 이후 요청 시 지연 초기화된다
+    try:
+        kis_client = await get_kis_client()
+        kis_client.start_indicator_stream()
+        logger.info("Market indicator stream started")
+    except Exception as e:
+        logger.warning("KIS client init failed at startup; will retry lazily", error=str(e))
+
     # 트레이딩 시스템 시작 (개발 환경에서는 자동 시작하지 않음)
     # await trading_controller.start_trading_system()
     # logger.info("Trading system started")
@@ -102,6 +122,10 @@ async def shutdown_event():
     await data_simulator.stop_simulation()
     logger.info("Data simulator stopped")
 
+    # KIS 클라이언트 종료 (지표 푸시 태스크 포함)
+    await close_kis_client()
+    logger.info("KIS API client closed")
+
 
 if __name__ == "__main__":
     uvicorn.run(